@@ -1,16 +1,15 @@
 """The Solar Router integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN, PLATFORMS
 from .coordinator import SolarRouterCoordinator
-from .frontend import async_setup_frontend
-from .services import async_setup_services, async_unload_services
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,6 +23,9 @@ PLATFORMS_LIST: list[Platform] = [
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Solar Router from a config entry."""
+    from .frontend import async_setup_frontend
+    from .services import async_setup_services
+
     _LOGGER.info("Setting up Solar Router integration")
 
     # Create coordinator
@@ -32,21 +34,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Set up coordinator
     await coordinator.async_setup()
 
-    # Perform initial refresh
-    await coordinator.async_config_entry_first_refresh()
+    # Perform initial refresh while registering services; neither depends
+    # on the other
+    await asyncio.gather(
+        coordinator.async_config_entry_first_refresh(),
+        async_setup_services(hass),
+    )
 
     # Store coordinator
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    entry.runtime_data = coordinator
 
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS_LIST)
 
-    # Set up services
-    await async_setup_services(hass)
-
-    # Set up frontend resources (custom card)
-    await async_setup_frontend(hass)
+    # Set up frontend resources (custom card) without delaying entry setup
+    hass.async_create_background_task(
+        async_setup_frontend(hass), name="solar_router_frontend"
+    )
 
     # Reload on options update
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
@@ -56,17 +60,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    from .services import async_unload_services
+
     _LOGGER.info("Unloading Solar Router integration")
 
     # Unload platforms
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS_LIST)
 
     if unload_ok:
-        coordinator: SolarRouterCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: SolarRouterCoordinator = entry.runtime_data
         await coordinator.async_shutdown()
 
         # Unload services if no more entries
-        if not hass.data[DOMAIN]:
+        if not any(
+            other.state is ConfigEntryState.LOADED
+            for other in hass.config_entries.async_entries(DOMAIN)
+            if other.entry_id != entry.entry_id
+        ):
             await async_unload_services(hass)
 
     return unload_ok
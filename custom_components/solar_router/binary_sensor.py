@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import partial
 from typing import Any
 
 from homeassistant.components.binary_sensor import (
@@ -11,7 +12,7 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -19,7 +20,6 @@ from .const import (
     DEFAULT_MIN_DAILY_HEATING_TIME,
     DEFAULT_MIN_SOC,
     DEFAULT_MIN_SOLAR_POWER,
-    DOMAIN,
     NUMBER_MIN_DAILY_HEATING,
     NUMBER_MIN_SOC,
     NUMBER_MIN_SOLAR_POWER,
@@ -31,79 +31,122 @@ from .coordinator import SolarRouterCoordinator
 class SolarRouterBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Describes Solar Router binary sensor entity."""
 
-    value_fn: Callable[[dict[str, Any], dict[str, Any]], bool]
-
-
-def _get_option(entry: ConfigEntry, key: str, default: Any) -> Any:
-    """Get option from entry."""
-    return entry.options.get(key, entry.data.get(key, default))
-
-
-BINARY_SENSOR_DESCRIPTIONS: tuple[SolarRouterBinarySensorEntityDescription, ...] = (
-    SolarRouterBinarySensorEntityDescription(
-        key="heater_should_run",
-        translation_key="heater_should_run",
-        name="Heater Should Run",
-        device_class=BinarySensorDeviceClass.RUNNING,
-        icon="mdi:water-boiler",
-        value_fn=lambda data, opts: data.get("should_heat", False),
-    ),
-    SolarRouterBinarySensorEntityDescription(
-        key="is_heating",
-        translation_key="is_heating",
-        name="Currently Heating",
-        device_class=BinarySensorDeviceClass.HEAT,
-        icon="mdi:fire",
-        value_fn=lambda data, opts: data.get("is_heating", False),
-    ),
-    SolarRouterBinarySensorEntityDescription(
-        key="solar_sufficient",
-        translation_key="solar_sufficient",
-        name="Solar Power Sufficient",
-        device_class=BinarySensorDeviceClass.POWER,
-        icon="mdi:solar-power",
-        value_fn=lambda data, opts: data.get("solar_power", 0) >= opts.get(NUMBER_MIN_SOLAR_POWER, DEFAULT_MIN_SOLAR_POWER),
-    ),
-    SolarRouterBinarySensorEntityDescription(
-        key="battery_sufficient",
-        translation_key="battery_sufficient",
-        name="Battery Level Sufficient",
-        device_class=BinarySensorDeviceClass.BATTERY,
-        icon="mdi:battery-check",
-        value_fn=lambda data, opts: data.get("battery_soc", 0) >= opts.get(NUMBER_MIN_SOC, DEFAULT_MIN_SOC),
-    ),
-    SolarRouterBinarySensorEntityDescription(
-        key="fallback_needed",
-        translation_key="fallback_needed",
-        name="Fallback Heating Needed",
-        device_class=BinarySensorDeviceClass.PROBLEM,
-        icon="mdi:alert-circle",
-        value_fn=lambda data, opts: data.get("daily_heating_minutes", 0) < opts.get(NUMBER_MIN_DAILY_HEATING, DEFAULT_MIN_DAILY_HEATING_TIME),
-    ),
-    SolarRouterBinarySensorEntityDescription(
-        key="auto_mode_active",
-        translation_key="auto_mode_active",
-        name="Auto Mode Active",
-        icon="mdi:robot",
-        value_fn=lambda data, opts: data.get("auto_mode_enabled", False),
-    ),
-    SolarRouterBinarySensorEntityDescription(
-        key="tank_cold",
-        translation_key="tank_cold",
-        name="Tank Temperature Low",
-        device_class=BinarySensorDeviceClass.COLD,
-        icon="mdi:snowflake-thermometer",
-        value_fn=lambda data, opts: data.get("tank_temp_estimate", 50) < 40,
-    ),
-    SolarRouterBinarySensorEntityDescription(
-        key="tank_hot",
-        translation_key="tank_hot",
-        name="Tank Temperature OK",
-        device_class=BinarySensorDeviceClass.HEAT,
-        icon="mdi:thermometer-check",
-        value_fn=lambda data, opts: data.get("tank_temp_estimate", 0) >= 50,
-    ),
-)
+    value_fn: Callable[[dict[str, Any]], bool]
+
+
+def _heater_should_run(data: dict[str, Any]) -> bool:
+    """Return true if the rule engine wants the heater on."""
+    return data.get("should_heat", False)
+
+
+def _is_heating(data: dict[str, Any]) -> bool:
+    """Return true if the heater is currently heating."""
+    return data.get("is_heating", False)
+
+
+def _solar_sufficient(min_solar_power: float, data: dict[str, Any]) -> bool:
+    """Return true if solar power reaches the threshold."""
+    return data.get("solar_power", 0) >= min_solar_power
+
+
+def _battery_sufficient(min_soc: float, data: dict[str, Any]) -> bool:
+    """Return true if battery SoC reaches the threshold."""
+    return data.get("battery_soc", 0) >= min_soc
+
+
+def _fallback_needed(min_daily_heating: float, data: dict[str, Any]) -> bool:
+    """Return true if daily heating is below the minimum."""
+    return data.get("daily_heating_minutes", 0) < min_daily_heating
+
+
+def _auto_mode_active(data: dict[str, Any]) -> bool:
+    """Return true if auto mode is enabled."""
+    return data.get("auto_mode_enabled", False)
+
+
+def _tank_cold(data: dict[str, Any]) -> bool:
+    """Return true if the tank is below usable temperature."""
+    return data.get("tank_temp_estimate", 50) < 40
+
+
+def _tank_hot(data: dict[str, Any]) -> bool:
+    """Return true if the tank is at a comfortable temperature."""
+    return data.get("tank_temp_estimate", 0) >= 50
+
+
+def _build_descriptions(
+    options: dict[str, Any],
+) -> tuple[SolarRouterBinarySensorEntityDescription, ...]:
+    """Build binary sensor descriptions with thresholds bound from options."""
+    min_solar_power = options.get(NUMBER_MIN_SOLAR_POWER, DEFAULT_MIN_SOLAR_POWER)
+    min_soc = options.get(NUMBER_MIN_SOC, DEFAULT_MIN_SOC)
+    min_daily_heating = options.get(NUMBER_MIN_DAILY_HEATING, DEFAULT_MIN_DAILY_HEATING_TIME)
+
+    return (
+        SolarRouterBinarySensorEntityDescription(
+            key="heater_should_run",
+            translation_key="heater_should_run",
+            name="Heater Should Run",
+            device_class=BinarySensorDeviceClass.RUNNING,
+            icon="mdi:water-boiler",
+            value_fn=_heater_should_run,
+        ),
+        SolarRouterBinarySensorEntityDescription(
+            key="is_heating",
+            translation_key="is_heating",
+            name="Currently Heating",
+            device_class=BinarySensorDeviceClass.HEAT,
+            icon="mdi:fire",
+            value_fn=_is_heating,
+        ),
+        SolarRouterBinarySensorEntityDescription(
+            key="solar_sufficient",
+            translation_key="solar_sufficient",
+            name="Solar Power Sufficient",
+            device_class=BinarySensorDeviceClass.POWER,
+            icon="mdi:solar-power",
+            value_fn=partial(_solar_sufficient, min_solar_power),
+        ),
+        SolarRouterBinarySensorEntityDescription(
+            key="battery_sufficient",
+            translation_key="battery_sufficient",
+            name="Battery Level Sufficient",
+            device_class=BinarySensorDeviceClass.BATTERY,
+            icon="mdi:battery-check",
+            value_fn=partial(_battery_sufficient, min_soc),
+        ),
+        SolarRouterBinarySensorEntityDescription(
+            key="fallback_needed",
+            translation_key="fallback_needed",
+            name="Fallback Heating Needed",
+            device_class=BinarySensorDeviceClass.PROBLEM,
+            icon="mdi:alert-circle",
+            value_fn=partial(_fallback_needed, min_daily_heating),
+        ),
+        SolarRouterBinarySensorEntityDescription(
+            key="auto_mode_active",
+            translation_key="auto_mode_active",
+            name="Auto Mode Active",
+            icon="mdi:robot",
+            value_fn=_auto_mode_active,
+        ),
+        SolarRouterBinarySensorEntityDescription(
+            key="tank_cold",
+            translation_key="tank_cold",
+            name="Tank Temperature Low",
+            device_class=BinarySensorDeviceClass.COLD,
+            icon="mdi:snowflake-thermometer",
+            value_fn=_tank_cold,
+        ),
+        SolarRouterBinarySensorEntityDescription(
+            key="tank_hot",
+            translation_key="tank_hot",
+            name="Tank Temperature OK",
+            device_class=BinarySensorDeviceClass.HEAT,
+            icon="mdi:thermometer-check",
+            value_fn=_tank_hot,
+        ),
+    )
 
 
 async def async_setup_entry(
@@ -112,12 +155,13 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Solar Router binary sensors based on a config entry."""
-    coordinator: SolarRouterCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator: SolarRouterCoordinator = entry.runtime_data
 
-    async_add_entities(
+    entities = [
         SolarRouterBinarySensor(coordinator, description, entry)
-        for description in BINARY_SENSOR_DESCRIPTIONS
-    )
+        for description in _build_descriptions(coordinator.merged_options)
+    ]
+    async_add_entities(entities)
 
 
 class SolarRouterBinarySensor(
@@ -137,21 +181,19 @@ class SolarRouterBinarySensor(
         """Initialize the binary sensor."""
         super().__init__(coordinator)
         self.entity_description = description
-        self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": entry.title,
-            "manufacturer": "Solar Router",
-            "model": "Water Heater Router",
-            "sw_version": "1.0.0",
-        }
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if the binary sensor is on."""
-        if self.coordinator.data is None:
-            return None
-
-        options = {**self._entry.data, **self._entry.options}
-        return self.entity_description.value_fn(self.coordinator.data, options)
+        self._attr_device_info = coordinator.device_info
+        self._update_is_on()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_is_on()
+        super()._handle_coordinator_update()
+
+    def _update_is_on(self) -> None:
+        """Evaluate the sensor once so state reads are attribute lookups."""
+        data = self.coordinator.data
+        self._attr_is_on = (
+            None if data is None else self.entity_description.value_fn(data)
+        )
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache, partialmethod
 from typing import Any
 
 import voluptuous as vol
@@ -63,15 +64,17 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
-def get_entity_selector(domain: str | list[str]) -> selector.EntitySelector:
+@lru_cache(maxsize=None)
+def get_entity_selector(domain: str | tuple[str, ...]) -> selector.EntitySelector:
     """Get an entity selector for the given domain(s)."""
     if isinstance(domain, str):
-        domain = [domain]
+        domain = (domain,)
     return selector.EntitySelector(
-        selector.EntitySelectorConfig(domain=domain)
+        selector.EntitySelectorConfig(domain=list(domain))
     )
 
 
+@lru_cache(maxsize=None)
 def get_number_selector(
     min_val: float,
     max_val: float,
@@ -91,203 +94,198 @@ def get_number_selector(
     )
 
 
+@lru_cache(maxsize=None)
 def get_time_selector() -> selector.TimeSelector:
     """Get a time selector."""
     return selector.TimeSelector()
 
 
-class SolarRouterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
-    """Handle a config flow for Solar Router."""
+# Step schemas are built once at import; the options flow fills in the
+# current values with add_suggested_values_to_schema.
+_SCHEMA_USER = vol.Schema(
+    {
+        vol.Required(CONF_NAME, default="Solar Router"): str,
+    }
+)
 
-    VERSION = 1
+_SCHEMA_ENTITIES = vol.Schema(
+    {
+        vol.Required(CONF_BATTERY_SOC_ENTITY): get_entity_selector("sensor"),
+        vol.Required(CONF_SOLAR_POWER_ENTITY): get_entity_selector("sensor"),
+        vol.Optional(CONF_GRID_POWER_ENTITY): get_entity_selector("sensor"),
+        vol.Optional(CONF_BATTERY_POWER_ENTITY): get_entity_selector("sensor"),
+        vol.Required(CONF_HEATER_SWITCH_ENTITY): get_entity_selector(("switch", "input_boolean")),
+        vol.Optional(CONF_HEATER_POWER_ENTITY): get_entity_selector("sensor"),
+    }
+)
 
-    def __init__(self) -> None:
-        """Initialize the config flow."""
-        self._data: dict[str, Any] = {}
+_SCHEMA_WATER_TANK = vol.Schema(
+    {
+        vol.Required(
+            CONF_TANK_VOLUME, default=DEFAULT_TANK_VOLUME
+        ): get_number_selector(50, 500, 10, "L"),
+        vol.Required(
+            CONF_HEATER_WATTAGE, default=DEFAULT_HEATER_WATTAGE
+        ): get_number_selector(500, 5000, 100, "W"),
+        vol.Required(
+            CONF_TARGET_TEMP, default=DEFAULT_TARGET_TEMP
+        ): get_number_selector(40, 70, 1, "°C"),
+        vol.Required(
+            CONF_MIN_TEMP, default=DEFAULT_MIN_TEMP
+        ): get_number_selector(30, 50, 1, "°C"),
+        vol.Optional(
+            CONF_TANK_HEAT_LOSS_RATE, default=DEFAULT_TANK_HEAT_LOSS_RATE
+        ): get_number_selector(0.1, 2.0, 0.1, "°C/h"),
+        vol.Optional(
+            CONF_COLD_WATER_TEMP, default=DEFAULT_COLD_WATER_TEMP
+        ): get_number_selector(5, 25, 1, "°C"),
+        vol.Optional(
+            CONF_AMBIENT_TEMP, default=DEFAULT_AMBIENT_TEMP
+        ): get_number_selector(10, 30, 1, "°C"),
+    }
+)
 
-    async def async_step_user(
-        self, user_input: dict[str, Any] | None = None
-    ) -> FlowResult:
-        """Handle the initial step - basic setup."""
-        errors: dict[str, str] = {}
+_SCHEMA_THRESHOLDS = vol.Schema(
+    {
+        vol.Required(
+            NUMBER_MIN_SOC, default=DEFAULT_MIN_SOC
+        ): get_number_selector(30, 95, 5, "%"),
+        vol.Required(
+            NUMBER_MIN_SOLAR_POWER, default=DEFAULT_MIN_SOLAR_POWER
+        ): get_number_selector(500, 5000, 100, "W"),
+        vol.Required(
+            NUMBER_MIN_DAILY_HEATING, default=DEFAULT_MIN_DAILY_HEATING_TIME
+        ): get_number_selector(0, 240, 15, "min"),
+    }
+)
 
-        if user_input is not None:
-            self._data.update(user_input)
-            return await self.async_step_entities()
+_SCHEMA_TIME_WINDOWS = vol.Schema(
+    {
+        vol.Required(
+            CONF_SOLAR_START, default=DEFAULT_SOLAR_START
+        ): get_time_selector(),
+        vol.Required(
+            CONF_SOLAR_END, default=DEFAULT_SOLAR_END
+        ): get_time_selector(),
+        vol.Required(
+            CONF_FALLBACK_CHECK_TIME, default=DEFAULT_FALLBACK_CHECK_TIME
+        ): get_time_selector(),
+        vol.Required(
+            CONF_OFFPEAK_START, default=DEFAULT_OFFPEAK_START
+        ): get_time_selector(),
+        vol.Required(
+            CONF_OFFPEAK_END, default=DEFAULT_OFFPEAK_END
+        ): get_time_selector(),
+    }
+)
 
-        return self.async_show_form(
-            step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_NAME, default="Solar Router"): str,
-                }
-            ),
-            errors=errors,
-        )
+_SCHEMA_USAGE_PATTERNS = vol.Schema(
+    {
+        vol.Optional(
+            CONF_SHOWER_DURATION, default=DEFAULT_SHOWER_DURATION
+        ): get_number_selector(5, 30, 1, "min"),
+        vol.Optional(
+            CONF_SHOWER_FLOW_RATE, default=DEFAULT_SHOWER_FLOW_RATE
+        ): get_number_selector(5, 15, 1, "L/min"),
+        vol.Optional(
+            CONF_DISH_DURATION, default=DEFAULT_DISH_DURATION
+        ): get_number_selector(5, 30, 1, "min"),
+        vol.Optional(
+            CONF_DISH_FLOW_RATE, default=DEFAULT_DISH_FLOW_RATE
+        ): get_number_selector(3, 10, 1, "L/min"),
+    }
+)
 
-    async def async_step_entities(
-        self, user_input: dict[str, Any] | None = None
-    ) -> FlowResult:
-        """Handle entity configuration step."""
-        errors: dict[str, str] = {}
 
-        if user_input is not None:
-            self._data.update(user_input)
-            return await self.async_step_water_tank()
+# Form steps shared by both flows: (step_id, schema, next config flow step).
+# A next step of None ends the config flow by creating the entry.
+_STEPS: tuple[tuple[str, vol.Schema, str | None], ...] = (
+    ("entities", _SCHEMA_ENTITIES, "water_tank"),
+    ("water_tank", _SCHEMA_WATER_TANK, "thresholds"),
+    ("thresholds", _SCHEMA_THRESHOLDS, "time_windows"),
+    ("time_windows", _SCHEMA_TIME_WINDOWS, "usage_patterns"),
+    ("usage_patterns", _SCHEMA_USAGE_PATTERNS, None),
+)
 
-        return self.async_show_form(
-            step_id="entities",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_BATTERY_SOC_ENTITY): get_entity_selector("sensor"),
-                    vol.Required(CONF_SOLAR_POWER_ENTITY): get_entity_selector("sensor"),
-                    vol.Optional(CONF_GRID_POWER_ENTITY): get_entity_selector("sensor"),
-                    vol.Optional(CONF_BATTERY_POWER_ENTITY): get_entity_selector("sensor"),
-                    vol.Required(CONF_HEATER_SWITCH_ENTITY): get_entity_selector(["switch", "input_boolean"]),
-                    vol.Optional(CONF_HEATER_POWER_ENTITY): get_entity_selector("sensor"),
-                }
-            ),
-            errors=errors,
-            description_placeholders={
-                "victron_hint": "Select entities from your Victron integration",
-            },
+# Options flow variants of the step schemas: every field optional and without
+# a default, so a field the user clears keeps its saved value instead of
+# being filled with the constant default
+_OPTIONS_SCHEMAS: dict[str, vol.Schema] = {
+    step_id: vol.Schema(
+        {vol.Optional(key.schema): validator for key, validator in schema.schema.items()}
+    )
+    for step_id, schema, _ in _STEPS
+}
+
+_STEP_PLACEHOLDERS: dict[str, dict[str, str]] = {
+    "entities": {
+        "victron_hint": "Select entities from your Victron integration",
+    },
+}
+
+
+def _with_steps(cls: type) -> type:
+    """Attach an async_step_<step_id> handler for every entry in _STEPS."""
+    for step_id, schema, next_step in _STEPS:
+        setattr(
+            cls,
+            f"async_step_{step_id}",
+            partialmethod(cls._async_handle_step, step_id, schema, next_step),
         )
+    return cls
 
-    async def async_step_water_tank(
-        self, user_input: dict[str, Any] | None = None
-    ) -> FlowResult:
-        """Handle water tank configuration step."""
-        errors: dict[str, str] = {}
-
-        if user_input is not None:
-            self._data.update(user_input)
-            return await self.async_step_thresholds()
-
-        return self.async_show_form(
-            step_id="water_tank",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_TANK_VOLUME, default=DEFAULT_TANK_VOLUME
-                    ): get_number_selector(50, 500, 10, "L"),
-                    vol.Required(
-                        CONF_HEATER_WATTAGE, default=DEFAULT_HEATER_WATTAGE
-                    ): get_number_selector(500, 5000, 100, "W"),
-                    vol.Required(
-                        CONF_TARGET_TEMP, default=DEFAULT_TARGET_TEMP
-                    ): get_number_selector(40, 70, 1, "°C"),
-                    vol.Required(
-                        CONF_MIN_TEMP, default=DEFAULT_MIN_TEMP
-                    ): get_number_selector(30, 50, 1, "°C"),
-                    vol.Optional(
-                        CONF_TANK_HEAT_LOSS_RATE, default=DEFAULT_TANK_HEAT_LOSS_RATE
-                    ): get_number_selector(0.1, 2.0, 0.1, "°C/h"),
-                    vol.Optional(
-                        CONF_COLD_WATER_TEMP, default=DEFAULT_COLD_WATER_TEMP
-                    ): get_number_selector(5, 25, 1, "°C"),
-                    vol.Optional(
-                        CONF_AMBIENT_TEMP, default=DEFAULT_AMBIENT_TEMP
-                    ): get_number_selector(10, 30, 1, "°C"),
-                }
-            ),
-            errors=errors,
-        )
 
-    async def async_step_thresholds(
-        self, user_input: dict[str, Any] | None = None
-    ) -> FlowResult:
-        """Handle threshold configuration step."""
-        errors: dict[str, str] = {}
+@_with_steps
+class SolarRouterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
+    """Handle a config flow for Solar Router."""
 
-        if user_input is not None:
-            self._data.update(user_input)
-            return await self.async_step_time_windows()
+    VERSION = 1
 
-        return self.async_show_form(
-            step_id="thresholds",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        NUMBER_MIN_SOC, default=DEFAULT_MIN_SOC
-                    ): get_number_selector(30, 95, 5, "%"),
-                    vol.Required(
-                        NUMBER_MIN_SOLAR_POWER, default=DEFAULT_MIN_SOLAR_POWER
-                    ): get_number_selector(500, 5000, 100, "W"),
-                    vol.Required(
-                        NUMBER_MIN_DAILY_HEATING, default=DEFAULT_MIN_DAILY_HEATING_TIME
-                    ): get_number_selector(0, 240, 15, "min"),
-                }
-            ),
-            errors=errors,
-        )
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._data: dict[str, Any] = {}
 
-    async def async_step_time_windows(
+    async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
-        """Handle time window configuration step."""
+        """Handle the initial step - basic setup."""
         errors: dict[str, str] = {}
 
         if user_input is not None:
             self._data.update(user_input)
-            return await self.async_step_usage_patterns()
+            return await self.async_step_entities()
 
         return self.async_show_form(
-            step_id="time_windows",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_SOLAR_START, default=DEFAULT_SOLAR_START
-                    ): get_time_selector(),
-                    vol.Required(
-                        CONF_SOLAR_END, default=DEFAULT_SOLAR_END
-                    ): get_time_selector(),
-                    vol.Required(
-                        CONF_FALLBACK_CHECK_TIME, default=DEFAULT_FALLBACK_CHECK_TIME
-                    ): get_time_selector(),
-                    vol.Required(
-                        CONF_OFFPEAK_START, default=DEFAULT_OFFPEAK_START
-                    ): get_time_selector(),
-                    vol.Required(
-                        CONF_OFFPEAK_END, default=DEFAULT_OFFPEAK_END
-                    ): get_time_selector(),
-                }
-            ),
+            step_id="user",
+            data_schema=_SCHEMA_USER,
             errors=errors,
         )
 
-    async def async_step_usage_patterns(
-        self, user_input: dict[str, Any] | None = None
+    async def _async_handle_step(
+        self,
+        step_id: str,
+        schema: vol.Schema,
+        next_step: str | None,
+        user_input: dict[str, Any] | None = None,
     ) -> FlowResult:
-        """Handle usage patterns configuration step."""
+        """Handle a configuration step listed in _STEPS."""
         errors: dict[str, str] = {}
 
         if user_input is not None:
             self._data.update(user_input)
-            # Create the config entry
-            return self.async_create_entry(
-                title=self._data.get(CONF_NAME, "Solar Router"),
-                data=self._data,
-            )
+            if next_step is None:
+                # Create the config entry
+                return self.async_create_entry(
+                    title=self._data.get(CONF_NAME, "Solar Router"),
+                    data=self._data,
+                )
+            return await getattr(self, f"async_step_{next_step}")()
 
         return self.async_show_form(
-            step_id="usage_patterns",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(
-                        CONF_SHOWER_DURATION, default=DEFAULT_SHOWER_DURATION
-                    ): get_number_selector(5, 30, 1, "min"),
-                    vol.Optional(
-                        CONF_SHOWER_FLOW_RATE, default=DEFAULT_SHOWER_FLOW_RATE
-                    ): get_number_selector(5, 15, 1, "L/min"),
-                    vol.Optional(
-                        CONF_DISH_DURATION, default=DEFAULT_DISH_DURATION
-                    ): get_number_selector(5, 30, 1, "min"),
-                    vol.Optional(
-                        CONF_DISH_FLOW_RATE, default=DEFAULT_DISH_FLOW_RATE
-                    ): get_number_selector(3, 10, 1, "L/min"),
-                }
-            ),
+            step_id=step_id,
+            data_schema=schema,
             errors=errors,
+            description_placeholders=_STEP_PLACEHOLDERS.get(step_id),
         )
 
     @staticmethod
@@ -299,6 +297,7 @@ class SolarRouterConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return SolarRouterOptionsFlow(config_entry)
 
 
+@_with_steps
 class SolarRouterOptionsFlow(config_entries.OptionsFlow):
     """Handle options flow for Solar Router."""
 
@@ -306,6 +305,7 @@ class SolarRouterOptionsFlow(config_entries.OptionsFlow):
         """Initialize options flow."""
         self.config_entry = config_entry
         self._data: dict[str, Any] = dict(config_entry.options)
+        self._current: dict[str, Any] = {**config_entry.data, **config_entry.options}
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -313,195 +313,28 @@ class SolarRouterOptionsFlow(config_entries.OptionsFlow):
         """Manage the options - show menu."""
         return self.async_show_menu(
             step_id="init",
-            menu_options=["entities", "water_tank", "thresholds", "time_windows", "usage_patterns"],
-        )
-
-    async def async_step_entities(
-        self, user_input: dict[str, Any] | None = None
-    ) -> FlowResult:
-        """Handle entity options."""
-        if user_input is not None:
-            self._data.update(user_input)
-            return self.async_create_entry(title="", data=self._data)
-
-        current = {**self.config_entry.data, **self.config_entry.options}
-
-        return self.async_show_form(
-            step_id="entities",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_BATTERY_SOC_ENTITY,
-                        default=current.get(CONF_BATTERY_SOC_ENTITY),
-                    ): get_entity_selector("sensor"),
-                    vol.Required(
-                        CONF_SOLAR_POWER_ENTITY,
-                        default=current.get(CONF_SOLAR_POWER_ENTITY),
-                    ): get_entity_selector("sensor"),
-                    vol.Optional(
-                        CONF_GRID_POWER_ENTITY,
-                        default=current.get(CONF_GRID_POWER_ENTITY),
-                    ): get_entity_selector("sensor"),
-                    vol.Optional(
-                        CONF_BATTERY_POWER_ENTITY,
-                        default=current.get(CONF_BATTERY_POWER_ENTITY),
-                    ): get_entity_selector("sensor"),
-                    vol.Required(
-                        CONF_HEATER_SWITCH_ENTITY,
-                        default=current.get(CONF_HEATER_SWITCH_ENTITY),
-                    ): get_entity_selector(["switch", "input_boolean"]),
-                    vol.Optional(
-                        CONF_HEATER_POWER_ENTITY,
-                        default=current.get(CONF_HEATER_POWER_ENTITY),
-                    ): get_entity_selector("sensor"),
-                }
-            ),
-        )
-
-    async def async_step_water_tank(
-        self, user_input: dict[str, Any] | None = None
-    ) -> FlowResult:
-        """Handle water tank options."""
-        if user_input is not None:
-            self._data.update(user_input)
-            return self.async_create_entry(title="", data=self._data)
-
-        current = {**self.config_entry.data, **self.config_entry.options}
-
-        return self.async_show_form(
-            step_id="water_tank",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_TANK_VOLUME,
-                        default=current.get(CONF_TANK_VOLUME, DEFAULT_TANK_VOLUME),
-                    ): get_number_selector(50, 500, 10, "L"),
-                    vol.Required(
-                        CONF_HEATER_WATTAGE,
-                        default=current.get(CONF_HEATER_WATTAGE, DEFAULT_HEATER_WATTAGE),
-                    ): get_number_selector(500, 5000, 100, "W"),
-                    vol.Required(
-                        CONF_TARGET_TEMP,
-                        default=current.get(CONF_TARGET_TEMP, DEFAULT_TARGET_TEMP),
-                    ): get_number_selector(40, 70, 1, "°C"),
-                    vol.Required(
-                        CONF_MIN_TEMP,
-                        default=current.get(CONF_MIN_TEMP, DEFAULT_MIN_TEMP),
-                    ): get_number_selector(30, 50, 1, "°C"),
-                    vol.Optional(
-                        CONF_TANK_HEAT_LOSS_RATE,
-                        default=current.get(CONF_TANK_HEAT_LOSS_RATE, DEFAULT_TANK_HEAT_LOSS_RATE),
-                    ): get_number_selector(0.1, 2.0, 0.1, "°C/h"),
-                    vol.Optional(
-                        CONF_COLD_WATER_TEMP,
-                        default=current.get(CONF_COLD_WATER_TEMP, DEFAULT_COLD_WATER_TEMP),
-                    ): get_number_selector(5, 25, 1, "°C"),
-                    vol.Optional(
-                        CONF_AMBIENT_TEMP,
-                        default=current.get(CONF_AMBIENT_TEMP, DEFAULT_AMBIENT_TEMP),
-                    ): get_number_selector(10, 30, 1, "°C"),
-                }
-            ),
-        )
-
-    async def async_step_thresholds(
-        self, user_input: dict[str, Any] | None = None
-    ) -> FlowResult:
-        """Handle threshold options."""
-        if user_input is not None:
-            self._data.update(user_input)
-            return self.async_create_entry(title="", data=self._data)
-
-        current = {**self.config_entry.data, **self.config_entry.options}
-
-        return self.async_show_form(
-            step_id="thresholds",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        NUMBER_MIN_SOC,
-                        default=current.get(NUMBER_MIN_SOC, DEFAULT_MIN_SOC),
-                    ): get_number_selector(30, 95, 5, "%"),
-                    vol.Required(
-                        NUMBER_MIN_SOLAR_POWER,
-                        default=current.get(NUMBER_MIN_SOLAR_POWER, DEFAULT_MIN_SOLAR_POWER),
-                    ): get_number_selector(500, 5000, 100, "W"),
-                    vol.Required(
-                        NUMBER_MIN_DAILY_HEATING,
-                        default=current.get(NUMBER_MIN_DAILY_HEATING, DEFAULT_MIN_DAILY_HEATING_TIME),
-                    ): get_number_selector(0, 240, 15, "min"),
-                }
-            ),
+            menu_options=[step_id for step_id, _, _ in _STEPS],
         )
 
-    async def async_step_time_windows(
-        self, user_input: dict[str, Any] | None = None
+    async def _async_handle_step(
+        self,
+        step_id: str,
+        schema: vol.Schema,
+        next_step: str | None,
+        user_input: dict[str, Any] | None = None,
     ) -> FlowResult:
-        """Handle time window options."""
+        """Handle an options step listed in _STEPS."""
+        options_schema = _OPTIONS_SCHEMAS[step_id]
         if user_input is not None:
+            # Fields left empty keep their saved value
+            for key in options_schema.schema:
+                name = key.schema
+                if name in self._current:
+                    self._data[name] = self._current[name]
             self._data.update(user_input)
             return self.async_create_entry(title="", data=self._data)
 
-        current = {**self.config_entry.data, **self.config_entry.options}
-
-        return self.async_show_form(
-            step_id="time_windows",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_SOLAR_START,
-                        default=current.get(CONF_SOLAR_START, DEFAULT_SOLAR_START),
-                    ): get_time_selector(),
-                    vol.Required(
-                        CONF_SOLAR_END,
-                        default=current.get(CONF_SOLAR_END, DEFAULT_SOLAR_END),
-                    ): get_time_selector(),
-                    vol.Required(
-                        CONF_FALLBACK_CHECK_TIME,
-                        default=current.get(CONF_FALLBACK_CHECK_TIME, DEFAULT_FALLBACK_CHECK_TIME),
-                    ): get_time_selector(),
-                    vol.Required(
-                        CONF_OFFPEAK_START,
-                        default=current.get(CONF_OFFPEAK_START, DEFAULT_OFFPEAK_START),
-                    ): get_time_selector(),
-                    vol.Required(
-                        CONF_OFFPEAK_END,
-                        default=current.get(CONF_OFFPEAK_END, DEFAULT_OFFPEAK_END),
-                    ): get_time_selector(),
-                }
-            ),
-        )
-
-    async def async_step_usage_patterns(
-        self, user_input: dict[str, Any] | None = None
-    ) -> FlowResult:
-        """Handle usage pattern options."""
-        if user_input is not None:
-            self._data.update(user_input)
-            return self.async_create_entry(title="", data=self._data)
-
-        current = {**self.config_entry.data, **self.config_entry.options}
-
         return self.async_show_form(
-            step_id="usage_patterns",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(
-                        CONF_SHOWER_DURATION,
-                        default=current.get(CONF_SHOWER_DURATION, DEFAULT_SHOWER_DURATION),
-                    ): get_number_selector(5, 30, 1, "min"),
-                    vol.Optional(
-                        CONF_SHOWER_FLOW_RATE,
-                        default=current.get(CONF_SHOWER_FLOW_RATE, DEFAULT_SHOWER_FLOW_RATE),
-                    ): get_number_selector(5, 15, 1, "L/min"),
-                    vol.Optional(
-                        CONF_DISH_DURATION,
-                        default=current.get(CONF_DISH_DURATION, DEFAULT_DISH_DURATION),
-                    ): get_number_selector(5, 30, 1, "min"),
-                    vol.Optional(
-                        CONF_DISH_FLOW_RATE,
-                        default=current.get(CONF_DISH_FLOW_RATE, DEFAULT_DISH_FLOW_RATE),
-                    ): get_number_selector(3, 10, 1, "L/min"),
-                }
-            ),
+            step_id=step_id,
+            data_schema=self.add_suggested_values_to_schema(options_schema, self._current),
         )
@@ -1,5 +1,5 @@
 """Constants for the Solar Router integration."""
-from enum import Enum
+from enum import StrEnum
 from typing import Final
 
 DOMAIN: Final = "solar_router"
@@ -72,7 +72,7 @@ DEFAULT_SOLAR_START: Final = "10:00"
 DEFAULT_SOLAR_END: Final = "17:00"
 
 
-class HeatingMode(Enum):
+class HeatingMode(StrEnum):
     """Heating modes."""
 
     OFF = "off"
@@ -82,7 +82,7 @@ class HeatingMode(Enum):
     OFFPEAK = "offpeak"
 
 
-class RuleConditionType(Enum):
+class RuleConditionType(StrEnum):
     """Types of conditions for rules."""
 
     BATTERY_SOC_ABOVE = "battery_soc_above"
@@ -99,7 +99,7 @@ class RuleConditionType(Enum):
     OFFPEAK_HOURS = "offpeak_hours"
 
 
-class RuleActionType(Enum):
+class RuleActionType(StrEnum):
     """Types of actions for rules."""
 
     TURN_ON_HEATER = "turn_on_heater"
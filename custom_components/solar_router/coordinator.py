@@ -1,14 +1,22 @@
 """Data coordinator for Solar Router integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import math
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.event import async_track_time_interval, async_track_time_change
+from homeassistant.const import STATE_ON, STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import (
+    async_track_state_change_event,
+    async_track_time_change,
+    async_track_time_interval,
+)
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
@@ -41,12 +49,51 @@ from .const import (
     STORAGE_KEY,
     STORAGE_VERSION,
 )
-from .rule_engine import RuleEngine
+from .rule_engine import RuleEngine, time_to_minutes
 from .water_tank import WaterTankModel
 
 _LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(seconds=DEFAULT_CHECK_INTERVAL)
+SAVE_INTERVAL = 300  # Seconds between periodic state saves
+SAVE_DELAY = 5  # Seconds to coalesce state changes into one write
+# Refreshes closer together than this are skipped unless a tracked entity changed
+MIN_IDLE_REFRESH_INTERVAL = DEFAULT_CHECK_INTERVAL / 2
+
+# Options read by the coordinator and their defaults
+_OPTION_DEFAULTS: dict[str, Any] = {
+    CONF_BATTERY_SOC_ENTITY: None,
+    CONF_SOLAR_POWER_ENTITY: None,
+    CONF_GRID_POWER_ENTITY: None,
+    CONF_BATTERY_POWER_ENTITY: None,
+    CONF_HEATER_POWER_ENTITY: None,
+    CONF_HEATER_SWITCH_ENTITY: None,
+    CONF_TANK_VOLUME: DEFAULT_TANK_VOLUME,
+    CONF_HEATER_WATTAGE: DEFAULT_HEATER_WATTAGE,
+    CONF_TANK_HEAT_LOSS_RATE: DEFAULT_TANK_HEAT_LOSS_RATE,
+    CONF_OFFPEAK_START: DEFAULT_OFFPEAK_START,
+    CONF_OFFPEAK_END: DEFAULT_OFFPEAK_END,
+}
+
+# Device details shared by every entry; identifiers and name are per entry
+_DEVICE_INFO_TEMPLATE = MappingProxyType(
+    {
+        "manufacturer": "Solar Router",
+        "model": "Water Heater Router",
+        "sw_version": "1.0.0",
+    }
+)
+
+_UNAVAILABLE_STATES = frozenset((STATE_UNAVAILABLE, STATE_UNKNOWN))
+
+# Numeric sensors read every update: (data key, entity option, default value)
+_SENSOR_MAP: tuple[tuple[str, str, float], ...] = (
+    ("battery_soc", CONF_BATTERY_SOC_ENTITY, 0),
+    ("solar_power", CONF_SOLAR_POWER_ENTITY, 0),
+    ("grid_power", CONF_GRID_POWER_ENTITY, 0),
+    ("battery_power", CONF_BATTERY_POWER_ENTITY, 0),
+    ("heater_power", CONF_HEATER_POWER_ENTITY, 0),
+)
 
 
 class SolarRouterCoordinator(DataUpdateCoordinator):
@@ -61,36 +108,83 @@ class SolarRouterCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=DOMAIN,
             update_interval=SCAN_INTERVAL,
+            always_update=False,
         )
 
         self.config_entry = entry
-        self._entry_data = entry.data
-        self._entry_options = entry.options
+
+        # Options take precedence over data; the entry is reloaded on change
+        self.merged_options: dict[str, Any] = {**entry.data, **entry.options}
+        self._options: dict[str, Any] = {
+            key: self.merged_options.get(key, default)
+            for key, default in _OPTION_DEFAULTS.items()
+        }
+        self._heater_entity: str | None = self._options[CONF_HEATER_SWITCH_ENTITY]
+        self._heater_domain: str | None = (
+            self._heater_entity.split(".")[0] if self._heater_entity else None
+        )
+        # Only configured sensors are polled
+        self._sensor_entities: list[tuple[str, str, float]] = [
+            (key, self._options[conf_key], default)
+            for key, conf_key, default in _SENSOR_MAP
+            if self._options[conf_key]
+        ]
+
+        # Shared by every entity of this entry
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=entry.title,
+            **_DEVICE_INFO_TEMPLATE,
+        )
 
         # Initialize components
         self.rule_engine = RuleEngine()
         self.water_tank = WaterTankModel(
-            volume_liters=self._get_option(CONF_TANK_VOLUME, DEFAULT_TANK_VOLUME),
-            heater_wattage=self._get_option(CONF_HEATER_WATTAGE, DEFAULT_HEATER_WATTAGE),
-            heat_loss_rate=self._get_option(CONF_TANK_HEAT_LOSS_RATE, DEFAULT_TANK_HEAT_LOSS_RATE),
+            volume_liters=self._get_option(CONF_TANK_VOLUME),
+            heater_wattage=self._get_option(CONF_HEATER_WATTAGE),
+            heat_loss_rate=self._get_option(CONF_TANK_HEAT_LOSS_RATE),
         )
 
         # State
         self._heating_mode = HeatingMode.AUTO
         self._auto_mode_enabled = True
         self._offpeak_fallback_enabled = True
-        self._last_update_time: datetime | None = None
+        self._last_update_mono = 0.0  # Event loop monotonic time
         self._heater_was_on = False
+        self._last_decision: tuple[bool, str | None] | None = None
+
+        # Rule context: option-derived fields are fixed for the entry's
+        # lifetime (options changes reload it), the rest is refilled per tick
+        self._static_context: dict[str, Any] = {
+            "offpeak_start_min": time_to_minutes(self._get_option(CONF_OFFPEAK_START)),
+            "offpeak_end_min": time_to_minutes(self._get_option(CONF_OFFPEAK_END)),
+        }
+        self._ctx_scratch: dict[str, Any] = {}
+        self._mode_fields: dict[str, Any] = {}
+        self._refresh_mode_fields()
 
         # Storage for persistence
         self._store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}_{entry.entry_id}")
+        self._last_saved_data: dict | None = None
+        self._last_save_time = hass.loop.time()
+
+        # Incremented whenever the data changes, for per-update caches in entities
+        self.update_count = 0
+
+        # Set when a tracked entity changes state, cleared after each update
+        self._dirty = True
+
+        # Serializes updates: a control call can request a refresh while a
+        # scheduled one is still awaiting the heater
+        self._update_lock = asyncio.Lock()
 
         # Unsub handlers
         self._unsub_midnight: callable | None = None
+        self._unsub_state_changes: callable | None = None
 
-    def _get_option(self, key: str, default: Any) -> Any:
+    def _get_option(self, key: str) -> Any:
         """Get option from options or data."""
-        return self._entry_options.get(key, self._entry_data.get(key, default))
+        return self._options[key]
 
     async def async_setup(self) -> None:
         """Set up the coordinator."""
@@ -98,6 +192,7 @@ class SolarRouterCoordinator(DataUpdateCoordinator):
         stored = await self._store.async_load()
         if stored:
             self._load_stored_data(stored)
+            self._last_saved_data = stored
 
         # Set up midnight reset
         self._unsub_midnight = async_track_time_change(
@@ -108,25 +203,50 @@ class SolarRouterCoordinator(DataUpdateCoordinator):
             second=0,
         )
 
+        # Note input changes so an early refresh is not skipped as idle; the
+        # update interval still drives the tank model and the rules, so noisy
+        # power sensors cannot make the heater switch faster than that
+        tracked = [entity_id for _, entity_id, _ in self._sensor_entities]
+        if self._heater_entity:
+            tracked.append(self._heater_entity)
+        if tracked:
+            self._unsub_state_changes = async_track_state_change_event(
+                self.hass, tracked, self._async_state_changed
+            )
+
     async def async_shutdown(self) -> None:
         """Shutdown the coordinator."""
         if self._unsub_midnight:
             self._unsub_midnight()
             self._unsub_midnight = None
+        if self._unsub_state_changes:
+            self._unsub_state_changes()
+            self._unsub_state_changes = None
 
-        # Save state
-        await self._async_save_state()
+        # Save state, superseding any pending delayed write
+        data = self._build_store_data()
+        await self._store.async_save(data)
+        self._last_saved_data = data
 
-    async def _async_save_state(self) -> None:
-        """Save current state to storage."""
-        data = {
+    def _build_store_data(self) -> dict[str, Any]:
+        """Build the state to persist."""
+        return {
             "water_tank": self.water_tank.to_dict(),
             "rules": self.rule_engine.to_dict(),
-            "heating_mode": self._heating_mode.value,
+            "heating_mode": self._heating_mode,
             "auto_mode_enabled": self._auto_mode_enabled,
             "offpeak_fallback_enabled": self._offpeak_fallback_enabled,
         }
-        await self._store.async_save(data)
+
+    @callback
+    def _schedule_save_state(self) -> None:
+        """Schedule a delayed write of the current state if it changed."""
+        self._last_save_time = self.hass.loop.time()
+        data = self._build_store_data()
+        if data == self._last_saved_data:
+            return
+        self._last_saved_data = data
+        self._store.async_delay_save(self._build_store_data, SAVE_DELAY)
 
     def _load_stored_data(self, data: dict) -> None:
         """Load state from storage."""
@@ -138,28 +258,57 @@ class SolarRouterCoordinator(DataUpdateCoordinator):
             self._heating_mode = HeatingMode(data["heating_mode"])
         self._auto_mode_enabled = data.get("auto_mode_enabled", True)
         self._offpeak_fallback_enabled = data.get("offpeak_fallback_enabled", True)
+        self._refresh_mode_fields()
+
+    def _refresh_mode_fields(self) -> None:
+        """Rebuild the cached mode values exposed in the coordinator data."""
+        self._mode_fields = {
+            "heating_mode": self._heating_mode,
+            "auto_mode_enabled": self._auto_mode_enabled,
+            "offpeak_fallback_enabled": self._offpeak_fallback_enabled,
+        }
 
     @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Mark the data dirty when a tracked entity changes state."""
+        self._dirty = True
+
     async def _async_midnight_reset(self, now: datetime) -> None:
         """Reset daily stats at midnight."""
         _LOGGER.info("Resetting daily statistics")
         self.water_tank.reset_daily_stats()
-        await self._async_save_state()
+        self._schedule_save_state()
+        self._dirty = True
         await self.async_refresh()
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data and run routing logic."""
-        now = dt_util.utcnow()
+        async with self._update_lock:
+            return await self._async_update_data_locked()
+
+    async def _async_update_data_locked(self) -> dict[str, Any]:
+        """Fetch data and run routing logic, holding the update lock."""
+        mono = self.hass.loop.time()
+
+        # Calculate elapsed time since last update
+        elapsed_seconds = mono - self._last_update_mono if self._last_update_mono else 0.0
+
+        # Nothing changed since the last update
+        if (
+            not self._dirty
+            and self.data is not None
+            and elapsed_seconds < MIN_IDLE_REFRESH_INTERVAL
+        ):
+            return self.data
+        self._dirty = False
+
+        # Claim the interval before awaiting so it is only counted once
+        self._last_update_mono = mono
 
         try:
             # Get current sensor values
             data = await self._async_get_sensor_data()
 
-            # Calculate elapsed time since last update
-            elapsed_seconds = 0.0
-            if self._last_update_time:
-                elapsed_seconds = (now - self._last_update_time).total_seconds()
-
             # Update water tank model
             heater_on = data.get("heater_on", False)
             self.water_tank.update_temperature(heater_on, elapsed_seconds)
@@ -174,38 +323,37 @@ class SolarRouterCoordinator(DataUpdateCoordinator):
                 data["triggered_rule"] = triggered_rule
 
                 # Control the heater
+                decision = (should_heat, triggered_rule)
                 if should_heat != heater_on:
                     await self._async_set_heater(should_heat)
 
-                    if should_heat:
-                        self.hass.bus.async_fire(EVENT_HEATING_STARTED, {
-                            "rule": triggered_rule,
-                            "tank_temp": self.water_tank.state.estimated_temp,
-                        })
-                    else:
-                        self.hass.bus.async_fire(EVENT_HEATING_STOPPED, {
-                            "rule": triggered_rule,
-                            "tank_temp": self.water_tank.state.estimated_temp,
-                        })
-
-                    if triggered_rule:
-                        self.hass.bus.async_fire(EVENT_RULE_TRIGGERED, {
-                            "rule": triggered_rule,
-                            "action": "turn_on" if should_heat else "turn_off",
-                        })
+                    # Announce only new decisions: if the heater did not follow
+                    # the previous identical one, the command is retried silently
+                    if decision != self._last_decision or heater_on != self._heater_was_on:
+                        fire = self.hass.bus.async_fire
+                        fire(
+                            EVENT_HEATING_STARTED if should_heat else EVENT_HEATING_STOPPED,
+                            {"rule": triggered_rule, "tank_temp": self.water_tank.state.estimated_temp},
+                        )
+                        if triggered_rule:
+                            fire(EVENT_RULE_TRIGGERED, {
+                                "rule": triggered_rule,
+                                "action": "turn_on" if should_heat else "turn_off",
+                            })
+                self._last_decision = decision
             else:
                 data["should_heat"] = None
                 data["triggered_rule"] = None
 
             # Add computed values
-            data.update(self._get_computed_values())
+            data.update(self._get_computed_values(context["daily_heating_minutes"]))
 
-            self._last_update_time = now
+            self.update_count += 1
             self._heater_was_on = data.get("heater_on", False)
 
             # Periodically save state
-            if elapsed_seconds > 300:  # Every 5 minutes
-                await self._async_save_state()
+            if mono - self._last_save_time >= SAVE_INTERVAL:
+                self._schedule_save_state()
 
             return data
 
@@ -215,99 +363,86 @@ class SolarRouterCoordinator(DataUpdateCoordinator):
 
     async def _async_get_sensor_data(self) -> dict[str, Any]:
         """Get current values from configured sensors."""
-        data = {}
-
-        # Battery SoC
-        soc_entity = self._get_option(CONF_BATTERY_SOC_ENTITY, None)
-        if soc_entity:
-            data["battery_soc"] = self._get_entity_value(soc_entity, 0)
-
-        # Solar power
-        solar_entity = self._get_option(CONF_SOLAR_POWER_ENTITY, None)
-        if solar_entity:
-            data["solar_power"] = self._get_entity_value(solar_entity, 0)
-
-        # Grid power
-        grid_entity = self._get_option(CONF_GRID_POWER_ENTITY, None)
-        if grid_entity:
-            data["grid_power"] = self._get_entity_value(grid_entity, 0)
-
-        # Battery power
-        battery_power_entity = self._get_option(CONF_BATTERY_POWER_ENTITY, None)
-        if battery_power_entity:
-            data["battery_power"] = self._get_entity_value(battery_power_entity, 0)
-
-        # Heater power consumption
-        heater_power_entity = self._get_option(CONF_HEATER_POWER_ENTITY, None)
-        if heater_power_entity:
-            data["heater_power"] = self._get_entity_value(heater_power_entity, 0)
+        data: dict[str, Any] = {}
+        states = self.hass.states
+
+        for key, entity_id, default in self._sensor_entities:
+            state = states.get(entity_id)
+            if state is None or state.state in _UNAVAILABLE_STATES:
+                data[key] = default
+                continue
+            try:
+                value = float(state.state)
+            except ValueError:
+                data[key] = default
+                continue
+            # nan/inf would poison the rule comparisons and the tank model
+            data[key] = value if math.isfinite(value) else default
 
         # Heater switch state
-        heater_switch_entity = self._get_option(CONF_HEATER_SWITCH_ENTITY, None)
-        if heater_switch_entity:
-            state = self.hass.states.get(heater_switch_entity)
-            data["heater_on"] = state.state == "on" if state else False
+        if self._heater_entity:
+            state = states.get(self._heater_entity)
+            data["heater_on"] = state is not None and state.state == STATE_ON
 
         return data
 
-    def _get_entity_value(self, entity_id: str, default: float) -> float:
-        """Get numeric value from entity state."""
-        state = self.hass.states.get(entity_id)
-        if state is None or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
-            return default
-        try:
-            return float(state.state)
-        except (ValueError, TypeError):
-            return default
-
     def _build_rule_context(self, data: dict) -> dict:
-        """Build context dictionary for rule evaluation."""
-        return {
-            "battery_soc": data.get("battery_soc", 0),
-            "solar_power": data.get("solar_power", 0),
-            "grid_power": data.get("grid_power", 0),
-            "battery_power": data.get("battery_power", 0),
-            "heater_power": data.get("heater_power", 0),
-            "tank_temp": self.water_tank.state.estimated_temp,
-            "daily_heating_minutes": self.water_tank.state.total_heating_today.total_seconds() / 60,
-            "offpeak_start": self._get_option(CONF_OFFPEAK_START, DEFAULT_OFFPEAK_START),
-            "offpeak_end": self._get_option(CONF_OFFPEAK_END, DEFAULT_OFFPEAK_END),
-        }
-
-    def _get_computed_values(self) -> dict:
-        """Get computed values from water tank model."""
-        time_to_target = self.water_tank.time_to_target()
-        time_to_cold = self.water_tank.time_to_cold()
+        """Build context dictionary for rule evaluation.
+
+        The same dict is reused every tick; rules must treat it as read-only.
+        """
+        state = self.water_tank.state
+        ctx = self._ctx_scratch
+        ctx.clear()
+        ctx.update(self._static_context)
+        ctx["_now_time"] = dt_util.now().time()
+        ctx["battery_soc"] = data.get("battery_soc", 0)
+        ctx["solar_power"] = data.get("solar_power", 0)
+        ctx["grid_power"] = data.get("grid_power", 0)
+        ctx["battery_power"] = data.get("battery_power", 0)
+        ctx["heater_power"] = data.get("heater_power", 0)
+        ctx["tank_temp"] = state.estimated_temp
+        ctx["daily_heating_minutes"] = state.total_heating_today_seconds / 60
+        return ctx
+
+    def _get_computed_values(self, heating_minutes: float | None = None) -> dict:
+        """Get computed values from water tank model.
+
+        heating_minutes may be passed when it was already computed this tick.
+        """
+        tank = self.water_tank
+        state = tank.state
+        time_to_target = tank.time_to_target()
+        time_to_cold = tank.time_to_cold()
+        if heating_minutes is None:
+            heating_minutes = state.total_heating_today_seconds / 60
 
         return {
-            "tank_temp_estimate": round(self.water_tank.state.estimated_temp, 1),
-            "daily_heating_minutes": round(self.water_tank.state.total_heating_today.total_seconds() / 60, 1),
-            "daily_heating_energy_kwh": round(self.water_tank.state.total_energy_today, 2),
-            "heating_sessions_today": self.water_tank.state.heating_sessions_today,
-            "energy_content_kwh": round(self.water_tank.energy_content(), 2),
-            "estimated_showers": self.water_tank.estimated_showers_available(),
+            "tank_temp_estimate": round(state.estimated_temp, 1),
+            "daily_heating_minutes": round(heating_minutes, 1),
+            "daily_heating_energy_kwh": round(state.total_energy_today, 2),
+            "heating_sessions_today": state.heating_sessions_today,
+            "energy_content_kwh": round(tank.energy_content(), 2),
+            "estimated_showers": tank.estimated_showers_available(),
             "time_to_target_minutes": round(time_to_target.total_seconds() / 60, 0) if time_to_target else None,
             "time_to_cold_hours": round(time_to_cold.total_seconds() / 3600, 1),
-            "heating_mode": self._heating_mode.value,
-            "auto_mode_enabled": self._auto_mode_enabled,
-            "offpeak_fallback_enabled": self._offpeak_fallback_enabled,
+            **self._mode_fields,
             "current_rule": self.rule_engine.last_triggered_rule,
-            "is_heating": self.water_tank.state.is_heating,
+            "is_heating": state.is_heating,
         }
 
     async def _async_set_heater(self, turn_on: bool) -> None:
         """Control the heater switch."""
-        heater_entity = self._get_option(CONF_HEATER_SWITCH_ENTITY, None)
+        heater_entity = self._heater_entity
         if not heater_entity:
             _LOGGER.warning("No heater switch entity configured")
             return
 
         service = "turn_on" if turn_on else "turn_off"
-        domain = heater_entity.split(".")[0]
 
         try:
             await self.hass.services.async_call(
-                domain,
+                self._heater_domain,
                 service,
                 {"entity_id": heater_entity},
                 blocking=True,
@@ -316,45 +451,78 @@ class SolarRouterCoordinator(DataUpdateCoordinator):
         except Exception as err:
             _LOGGER.error("Failed to control heater: %s", err)
 
+    @callback
+    def _apply_local_update(self, **overrides: Any) -> None:
+        """Patch the current data in place and notify listeners without a refresh."""
+        if self.data:
+            self.data.update(overrides)
+        self.update_count += 1
+        self.async_update_listeners()
+
     # Public methods for external control
 
     async def async_set_auto_mode(self, enabled: bool) -> None:
         """Enable or disable auto mode."""
         self._auto_mode_enabled = enabled
-        await self._async_save_state()
-        await self.async_refresh()
+        self._refresh_mode_fields()
+        self._schedule_save_state()
+        if enabled:
+            self._apply_local_update(**self._mode_fields)
+        else:
+            # Match what an update publishes while auto mode is off
+            self._apply_local_update(
+                **self._mode_fields, should_heat=None, triggered_rule=None
+            )
+        await self._async_request_decision()
 
     async def async_set_offpeak_fallback(self, enabled: bool) -> None:
         """Enable or disable off-peak fallback."""
         self._offpeak_fallback_enabled = enabled
-        self.rule_engine.enable_rule("offpeak_fallback") if enabled else self.rule_engine.disable_rule("offpeak_fallback")
-        await self._async_save_state()
-        await self.async_refresh()
+        self.rule_engine.set_rule_enabled("offpeak_fallback", enabled)
+        self._refresh_mode_fields()
+        self._schedule_save_state()
+        self._apply_local_update(**self._mode_fields)
+        await self._async_request_decision()
+
+    async def _async_request_decision(self) -> None:
+        """Refresh the data and re-evaluate the rules soon, bypassing the idle skip."""
+        self._dirty = True
+        await self.async_request_refresh()
 
     async def async_force_heating(self, duration_minutes: int = 60) -> None:
         """Force heating for specified duration."""
         self._heating_mode = HeatingMode.FORCED
+        self._refresh_mode_fields()
         await self._async_set_heater(True)
-        await self._async_save_state()
-        await self.async_refresh()
+        self._schedule_save_state()
+        self._apply_local_update(**self._mode_fields)
+        await self._async_request_decision()
 
     async def async_stop_heating(self) -> None:
         """Stop heating immediately."""
         await self._async_set_heater(False)
         self._heating_mode = HeatingMode.AUTO if self._auto_mode_enabled else HeatingMode.OFF
-        await self.async_refresh()
+        self._refresh_mode_fields()
+        self._apply_local_update(**self._mode_fields)
+        await self._async_request_decision()
 
     async def async_set_tank_temperature(self, temperature: float) -> None:
         """Manually set tank temperature estimate (for calibration)."""
         self.water_tank.set_temperature(temperature)
-        await self._async_save_state()
-        await self.async_refresh()
+        self._schedule_save_state()
+        self._apply_local_update(**self._get_computed_values())
 
     async def async_apply_usage_event(self, event_name: str) -> None:
         """Apply a water usage event (shower, dishes, etc.)."""
         self.water_tank.apply_usage_event(event_name)
-        await self._async_save_state()
-        await self.async_refresh()
+        self._schedule_save_state()
+        self._apply_local_update(**self._get_computed_values())
+
+    async def async_reset_daily_stats(self) -> None:
+        """Reset the daily heating statistics."""
+        self.water_tank.reset_daily_stats()
+        self._schedule_save_state()
+        self._apply_local_update(**self._get_computed_values())
 
     def get_temperature_forecast(self, hours: int = 24) -> list[dict]:
         """Get temperature forecast for the next N hours."""
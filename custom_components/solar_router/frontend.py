@@ -1,6 +1,7 @@
 """Frontend for Solar Router integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from pathlib import Path
 
@@ -12,27 +13,40 @@ _LOGGER = logging.getLogger(__name__)
 
 FRONTEND_SCRIPT_URL = "/solar_router/solar-router-flow-card.js"
 
+DATA_FRONTEND_REGISTERED = "solar_router_frontend_registered"
+DATA_FRONTEND_LOCK = "solar_router_frontend_lock"
+
+WWW_PATH = Path(__file__).parent.parent.parent / "www"
+WWW_PATH_STR = str(WWW_PATH)
+
 
 async def async_setup_frontend(hass: HomeAssistant) -> None:
     """Set up the Solar Router frontend resources."""
-    # Get the path to the frontend files
-    www_path = Path(__file__).parent.parent.parent / "www"
-
-    if www_path.exists():
-        # Register the static path
+    # Static paths can only be registered once per Home Assistant run; the
+    # lock keeps entries set up concurrently from registering twice
+    async with hass.data.setdefault(DATA_FRONTEND_LOCK, asyncio.Lock()):
+        if hass.data.get(DATA_FRONTEND_REGISTERED):
+            return
+
+        # Check for the frontend files without blocking the event loop
+        if not await hass.async_add_executor_job(WWW_PATH.exists):
+            _LOGGER.warning("Solar Router www folder not found at %s", WWW_PATH_STR)
+            return
+
+        # Register the static path; only mark it done once this succeeded so
+        # a later entry can retry after a failure
         await hass.http.async_register_static_paths(
             [
                 StaticPathConfig(
                     "/solar_router",
-                    str(www_path),
+                    WWW_PATH_STR,
                     cache_headers=False,
                 )
             ]
         )
+        hass.data[DATA_FRONTEND_REGISTERED] = True
 
-        # Add the JavaScript file to the frontend
-        add_extra_js_url(hass, FRONTEND_SCRIPT_URL)
+    # Add the JavaScript file to the frontend
+    add_extra_js_url(hass, FRONTEND_SCRIPT_URL)
 
-        _LOGGER.info("Solar Router frontend resources registered")
-    else:
-        _LOGGER.warning("Solar Router www folder not found at %s", www_path)
+    _LOGGER.info("Solar Router frontend resources registered")
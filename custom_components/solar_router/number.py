@@ -1,7 +1,7 @@
 """Number platform for Solar Router integration."""
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from typing import Any
 
@@ -22,7 +22,6 @@ from .const import (
     DEFAULT_MIN_SOC,
     DEFAULT_MIN_SOLAR_POWER,
     DEFAULT_TARGET_TEMP,
-    DOMAIN,
     NUMBER_MIN_DAILY_HEATING,
     NUMBER_MIN_SOC,
     NUMBER_MIN_SOLAR_POWER,
@@ -30,12 +29,43 @@ from .const import (
 from .coordinator import SolarRouterCoordinator
 
 
+async def _set_tank_calibration_value(entity: SolarRouterNumber, value: float) -> None:
+    """Calibrate the tank temperature estimate."""
+    await entity.coordinator.async_set_tank_temperature(value)
+
+
+async def _set_option_value(entity: SolarRouterNumber, value: float) -> None:
+    """Store the value in the config entry options."""
+    description = entity.entity_description
+    entity.hass.config_entries.async_update_entry(
+        entity._entry,
+        options={**entity._entry.options, description.config_key: value},
+    )
+
+
+def _get_tank_calibration_value(entity: SolarRouterNumber) -> float | None:
+    """Read the tank temperature estimate from the water tank model."""
+    if entity.coordinator.data:
+        return entity.coordinator.data.get("tank_temp_estimate")
+    return None
+
+
+def _get_option_value(entity: SolarRouterNumber) -> float | None:
+    """Read the value from the config entry options or data."""
+    description = entity.entity_description
+    return entity.coordinator.merged_options.get(
+        description.config_key, description.default_value
+    )
+
+
 @dataclass(frozen=True, kw_only=True)
 class SolarRouterNumberEntityDescription(NumberEntityDescription):
     """Describes Solar Router number entity."""
 
     config_key: str
     default_value: float
+    value_fn: Callable[[SolarRouterNumber], float | None] = _get_option_value
+    set_fn: Callable[[SolarRouterNumber, float], Awaitable[None]] = _set_option_value
 
 
 NUMBER_DESCRIPTIONS: tuple[SolarRouterNumberEntityDescription, ...] = (
@@ -92,6 +122,8 @@ NUMBER_DESCRIPTIONS: tuple[SolarRouterNumberEntityDescription, ...] = (
         mode=NumberMode.BOX,
         config_key="tank_temp_calibration",
         default_value=DEFAULT_TARGET_TEMP,
+        value_fn=_get_tank_calibration_value,
+        set_fn=_set_tank_calibration_value,
     ),
 )
 
@@ -102,7 +134,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Solar Router numbers based on a config entry."""
-    coordinator: SolarRouterCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator: SolarRouterCoordinator = entry.runtime_data
 
     async_add_entities(
         SolarRouterNumber(coordinator, description, entry)
@@ -127,44 +159,13 @@ class SolarRouterNumber(CoordinatorEntity[SolarRouterCoordinator], NumberEntity)
         self.entity_description = description
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": entry.title,
-            "manufacturer": "Solar Router",
-            "model": "Water Heater Router",
-            "sw_version": "1.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> float | None:
         """Return the current value."""
-        # Special case for temperature calibration - read from water tank model
-        if self.entity_description.key == "tank_temperature_calibration":
-            if self.coordinator.data:
-                return self.coordinator.data.get("tank_temp_estimate")
-            return None
-
-        # For other numbers, read from config
-        return self._entry.options.get(
-            self.entity_description.config_key,
-            self._entry.data.get(
-                self.entity_description.config_key,
-                self.entity_description.default_value,
-            ),
-        )
+        return self.entity_description.value_fn(self)
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-        # Special case for temperature calibration
-        if self.entity_description.key == "tank_temperature_calibration":
-            await self.coordinator.async_set_tank_temperature(value)
-            return
-
-        # For other numbers, update options
-        new_options = dict(self._entry.options)
-        new_options[self.entity_description.config_key] = value
-
-        self.hass.config_entries.async_update_entry(
-            self._entry,
-            options=new_options,
-        )
+        await self.entity_description.set_fn(self, value)
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime, time
 from typing import TYPE_CHECKING, Any
@@ -27,92 +28,159 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
-class RuleCondition:
-    """A condition that must be met for a rule to trigger."""
+def time_to_minutes(value: str | time) -> int:
+    """Convert an "HH:MM" string or time to minutes since midnight."""
+    if isinstance(value, time):
+        return value.hour * 60 + value.minute
+    hours, minutes = value.split(":")[:2]
+    hours, minutes = int(hours), int(minutes)
+    if not (0 <= hours < 24 and 0 <= minutes < 60):
+        raise ValueError(f"Time out of range: {value}")
+    return hours * 60 + minutes
 
-    condition_type: RuleConditionType
-    value: Any
-    value2: Any | None = None  # For range conditions like TIME_BETWEEN
 
-    def evaluate(self, context: dict) -> bool:
-        """Evaluate if this condition is met."""
-        try:
-            if self.condition_type == RuleConditionType.BATTERY_SOC_ABOVE:
-                return context.get("battery_soc", 0) >= self.value
+def minutes_in_range(check: int, start: int, end: int) -> bool:
+    """Check if a minute of day is in range, handling overnight ranges."""
+    return (check - start) % 1440 <= (end - start) % 1440
 
-            elif self.condition_type == RuleConditionType.BATTERY_SOC_BELOW:
-                return context.get("battery_soc", 100) <= self.value
 
-            elif self.condition_type == RuleConditionType.SOLAR_POWER_ABOVE:
-                return context.get("solar_power", 0) >= self.value
+_DEFAULT_OFFPEAK_START_MIN = time_to_minutes(DEFAULT_OFFPEAK_START)
+_DEFAULT_OFFPEAK_END_MIN = time_to_minutes(DEFAULT_OFFPEAK_END)
 
-            elif self.condition_type == RuleConditionType.SOLAR_POWER_BELOW:
-                return context.get("solar_power", float("inf")) <= self.value
 
-            elif self.condition_type == RuleConditionType.GRID_EXPORT_ABOVE:
-                grid_power = context.get("grid_power", 0)
-                # Negative grid power = export
-                return grid_power < 0 and abs(grid_power) >= self.value
+def _battery_soc_above(condition: RuleCondition, context: dict) -> bool:
+    """Battery state of charge is at or above the value."""
+    return context.get("battery_soc", 0) >= condition.value
 
-            elif self.condition_type == RuleConditionType.GRID_IMPORT_ABOVE:
-                grid_power = context.get("grid_power", 0)
-                # Positive grid power = import
-                return grid_power > 0 and grid_power >= self.value
 
-            elif self.condition_type == RuleConditionType.TANK_TEMP_ABOVE:
-                return context.get("tank_temp", 0) >= self.value
+def _battery_soc_below(condition: RuleCondition, context: dict) -> bool:
+    """Battery state of charge is at or below the value."""
+    return context.get("battery_soc", 100) <= condition.value
 
-            elif self.condition_type == RuleConditionType.TANK_TEMP_BELOW:
-                return context.get("tank_temp", 100) <= self.value
 
-            elif self.condition_type == RuleConditionType.TIME_BETWEEN:
-                now = dt_util.now().time()
-                start = self._parse_time(self.value)
-                end = self._parse_time(self.value2)
-                return self._time_in_range(now, start, end)
+def _solar_power_above(condition: RuleCondition, context: dict) -> bool:
+    """Solar production is at or above the value."""
+    return context.get("solar_power", 0) >= condition.value
 
-            elif self.condition_type == RuleConditionType.DAILY_HEATING_BELOW:
-                heating_minutes = context.get("daily_heating_minutes", 0)
-                return heating_minutes < self.value
 
-            elif self.condition_type == RuleConditionType.DAILY_HEATING_ABOVE:
-                heating_minutes = context.get("daily_heating_minutes", 0)
-                return heating_minutes >= self.value
+def _solar_power_below(condition: RuleCondition, context: dict) -> bool:
+    """Solar production is at or below the value."""
+    return context.get("solar_power", float("inf")) <= condition.value
 
-            elif self.condition_type == RuleConditionType.OFFPEAK_HOURS:
-                now = dt_util.now().time()
-                start = self._parse_time(context.get("offpeak_start", DEFAULT_OFFPEAK_START))
-                end = self._parse_time(context.get("offpeak_end", DEFAULT_OFFPEAK_END))
-                return self._time_in_range(now, start, end)
 
-            else:
-                _LOGGER.warning("Unknown condition type: %s", self.condition_type)
-                return False
+def _grid_export_above(condition: RuleCondition, context: dict) -> bool:
+    """Grid export is at or above the value."""
+    grid_power = context.get("grid_power", 0)
+    # Negative grid power = export
+    return grid_power < 0 and abs(grid_power) >= condition.value
+
+
+def _grid_import_above(condition: RuleCondition, context: dict) -> bool:
+    """Grid import is at or above the value."""
+    grid_power = context.get("grid_power", 0)
+    # Positive grid power = import
+    return grid_power > 0 and grid_power >= condition.value
+
+
+def _tank_temp_above(condition: RuleCondition, context: dict) -> bool:
+    """Tank temperature is at or above the value."""
+    return context.get("tank_temp", 0) >= condition.value
+
+
+def _tank_temp_below(condition: RuleCondition, context: dict) -> bool:
+    """Tank temperature is at or below the value."""
+    return context.get("tank_temp", 100) <= condition.value
+
+
+def _time_between(condition: RuleCondition, context: dict) -> bool:
+    """Current time is within the value to value2 window."""
+    start_min = condition._start_min
+    end_min = condition._end_min
+    if start_min is None or end_min is None:
+        # Malformed window, already logged when the condition was created
+        return False
+    now = context.get("_now_time") or dt_util.now().time()
+    return minutes_in_range(now.hour * 60 + now.minute, start_min, end_min)
+
+
+def _daily_heating_below(condition: RuleCondition, context: dict) -> bool:
+    """Heating time today is below the value in minutes."""
+    return context.get("daily_heating_minutes", 0) < condition.value
+
+
+def _daily_heating_above(condition: RuleCondition, context: dict) -> bool:
+    """Heating time today is at or above the value in minutes."""
+    return context.get("daily_heating_minutes", 0) >= condition.value
+
+
+def _offpeak_hours(condition: RuleCondition, context: dict) -> bool:
+    """Current time is within the configured off-peak window."""
+    now = context.get("_now_time") or dt_util.now().time()
+    return minutes_in_range(
+        now.hour * 60 + now.minute,
+        context.get("offpeak_start_min", _DEFAULT_OFFPEAK_START_MIN),
+        context.get("offpeak_end_min", _DEFAULT_OFFPEAK_END_MIN),
+    )
+
+
+_CONDITION_HANDLERS: dict[RuleConditionType, Callable[[RuleCondition, dict], bool]] = {
+    RuleConditionType.BATTERY_SOC_ABOVE: _battery_soc_above,
+    RuleConditionType.BATTERY_SOC_BELOW: _battery_soc_below,
+    RuleConditionType.SOLAR_POWER_ABOVE: _solar_power_above,
+    RuleConditionType.SOLAR_POWER_BELOW: _solar_power_below,
+    RuleConditionType.GRID_EXPORT_ABOVE: _grid_export_above,
+    RuleConditionType.GRID_IMPORT_ABOVE: _grid_import_above,
+    RuleConditionType.TANK_TEMP_ABOVE: _tank_temp_above,
+    RuleConditionType.TANK_TEMP_BELOW: _tank_temp_below,
+    RuleConditionType.TIME_BETWEEN: _time_between,
+    RuleConditionType.DAILY_HEATING_BELOW: _daily_heating_below,
+    RuleConditionType.DAILY_HEATING_ABOVE: _daily_heating_above,
+    RuleConditionType.OFFPEAK_HOURS: _offpeak_hours,
+}
+
+
+@dataclass(slots=True)
+class RuleCondition:
+    """A condition that must be met for a rule to trigger."""
+
+    condition_type: RuleConditionType
+    value: Any
+    value2: Any | None = None  # For range conditions like TIME_BETWEEN
+
+    _handler: Callable[[RuleCondition, dict], bool] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Parsed TIME_BETWEEN bounds; None if malformed, which fails evaluation
+    _start_min: int | None = field(default=None, init=False, repr=False, compare=False)
+    _end_min: int | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Resolve the handler and parse time bounds once instead of on every evaluation."""
+        self._handler = _CONDITION_HANDLERS.get(self.condition_type)
+        if self.condition_type == RuleConditionType.TIME_BETWEEN:
+            try:
+                self._start_min = time_to_minutes(self.value)
+                self._end_min = time_to_minutes(self.value2)
+            except (AttributeError, IndexError, ValueError, TypeError):
+                _LOGGER.error(
+                    "Invalid time range for condition: %s - %s", self.value, self.value2
+                )
+
+    def evaluate(self, context: dict) -> bool:
+        """Evaluate if this condition is met."""
+        handler = self._handler
+        if handler is None:
+            _LOGGER.warning("Unknown condition type: %s", self.condition_type)
+            return False
 
+        try:
+            return handler(self, context)
         except (ValueError, TypeError) as e:
             _LOGGER.error("Error evaluating condition %s: %s", self.condition_type, e)
             return False
 
-    @staticmethod
-    def _parse_time(time_str: str | time) -> time:
-        """Parse time string to time object."""
-        if isinstance(time_str, time):
-            return time_str
-        parts = time_str.split(":")
-        return time(int(parts[0]), int(parts[1]))
-
-    @staticmethod
-    def _time_in_range(check_time: time, start: time, end: time) -> bool:
-        """Check if time is in range, handling overnight ranges."""
-        if start <= end:
-            return start <= check_time <= end
-        else:
-            # Overnight range (e.g., 22:00 to 06:00)
-            return check_time >= start or check_time <= end
 
-
-@dataclass
+@dataclass(slots=True)
 class RuleAction:
     """An action to take when a rule triggers."""
 
@@ -122,7 +190,7 @@ class RuleAction:
     def to_dict(self) -> dict:
         """Convert to dictionary."""
         return {
-            "action_type": self.action_type.value,
+            "action_type": self.action_type,
             "value": self.value,
         }
 
@@ -135,22 +203,23 @@ class RuleAction:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Rule:
     """A routing rule with conditions and actions."""
 
     name: str
-    conditions: list[RuleCondition]
+    conditions: Sequence[RuleCondition]
     actions: list[RuleAction]
     enabled: bool = True
     priority: int = 50  # 0-100, higher = more important
     description: str = ""
 
     def evaluate(self, context: dict) -> bool:
-        """Check if all conditions are met."""
-        if not self.enabled:
-            return False
-        return all(condition.evaluate(context) for condition in self.conditions)
+        """Check if all conditions are met (the engine skips disabled rules)."""
+        for condition in self.conditions:
+            if not condition.evaluate(context):
+                return False
+        return True
 
     def to_dict(self) -> dict:
         """Convert to dictionary for storage."""
@@ -158,7 +227,7 @@ class Rule:
             "name": self.name,
             "conditions": [
                 {
-                    "condition_type": c.condition_type.value,
+                    "condition_type": c.condition_type,
                     "value": c.value,
                     "value2": c.value2,
                 }
@@ -175,14 +244,14 @@ class Rule:
         """Create rule from dictionary."""
         return cls(
             name=data["name"],
-            conditions=[
+            conditions=tuple(
                 RuleCondition(
                     condition_type=RuleConditionType(c["condition_type"]),
                     value=c["value"],
                     value2=c.get("value2"),
                 )
-                for c in data.get("conditions", [])
-            ],
+                for c in data.get("conditions", ())
+            ),
             actions=[RuleAction.from_dict(a) for a in data.get("actions", [])],
             enabled=data.get("enabled", True),
             priority=data.get("priority", 50),
@@ -196,8 +265,16 @@ class RuleEngine:
     def __init__(self) -> None:
         """Initialize the rule engine."""
         self.rules: list[Rule] = []
+        self._by_name: dict[str, Rule] = {}
+        self._sorted = False  # Rules are sorted lazily before evaluation
+        self._active_rules: list[Rule] = []  # Enabled rules, highest priority first
         self._last_triggered_rule: str | None = None
         self._create_default_rules()
+        self._reindex()
+
+    def _reindex(self) -> None:
+        """Rebuild the name to rule index."""
+        self._by_name = {rule.name: rule for rule in self.rules}
 
     def _create_default_rules(self) -> None:
         """Create default routing rules."""
@@ -289,72 +366,102 @@ class RuleEngine:
 
     def add_rule(self, rule: Rule) -> None:
         """Add a rule to the engine."""
-        # Remove existing rule with same name
-        self.rules = [r for r in self.rules if r.name != rule.name]
-        self.rules.append(rule)
-        self._sort_rules()
+        # Replace existing rule with same name in place
+        existing = self._by_name.get(rule.name)
+        if existing is not None:
+            self.rules[self.rules.index(existing)] = rule
+        else:
+            self.rules.append(rule)
+        self._by_name[rule.name] = rule
+        self._sorted = False
 
     def remove_rule(self, name: str) -> bool:
         """Remove a rule by name."""
-        initial_count = len(self.rules)
-        self.rules = [r for r in self.rules if r.name != name]
-        return len(self.rules) < initial_count
+        rule = self._by_name.pop(name, None)
+        if rule is None:
+            return False
+        self.rules.remove(rule)
+        self._sorted = False
+        return True
+
+    def set_rule_enabled(self, name: str, enabled: bool) -> bool:
+        """Enable or disable a rule by name."""
+        rule = self._by_name.get(name)
+        if rule is None:
+            return False
+        if rule.enabled != enabled:
+            rule.enabled = enabled
+            self._sorted = False
+        return True
 
     def enable_rule(self, name: str) -> bool:
         """Enable a rule by name."""
-        for rule in self.rules:
-            if rule.name == name:
-                rule.enabled = True
-                return True
-        return False
+        return self.set_rule_enabled(name, True)
 
     def disable_rule(self, name: str) -> bool:
         """Disable a rule by name."""
-        for rule in self.rules:
-            if rule.name == name:
-                rule.enabled = False
-                return True
-        return False
+        return self.set_rule_enabled(name, False)
 
     def get_rule(self, name: str) -> Rule | None:
         """Get a rule by name."""
-        for rule in self.rules:
-            if rule.name == name:
-                return rule
-        return None
+        return self._by_name.get(name)
 
     def _sort_rules(self) -> None:
-        """Sort rules by priority (highest first)."""
+        """Sort rules by priority (highest first) and collect the enabled ones."""
         self.rules.sort(key=lambda r: r.priority, reverse=True)
+        self._active_rules = [r for r in self.rules if r.enabled]
+        self._sorted = True
 
-    def evaluate(self, context: dict) -> tuple[list[RuleAction], list[str]]:
+    def _match(self, context: dict) -> Rule | None:
+        """Return the highest priority enabled rule whose conditions are met."""
+        if not self._sorted:
+            self._sort_rules()
+
+        # For conflicting actions, higher priority wins
+        # We process in priority order, so first match wins
+        for rule in self._active_rules:
+            if rule.evaluate(context):
+                _LOGGER.debug("Rule '%s' triggered", rule.name)
+                self._last_triggered_rule = rule.name
+                return rule
+
+        self._last_triggered_rule = None
+        return None
+
+    def _evaluate_decision(self, context: dict) -> tuple[bool | None, str | None]:
         """
-        Evaluate all rules and return actions to take.
+        Evaluate rules down to a heater decision.
 
         Returns:
-            Tuple of (actions to execute, list of triggered rule names)
+            Tuple of (True/False from the winning rule's first heater action,
+            or None if there is none, triggered rule name)
         """
-        triggered_rules: list[str] = []
-        actions: list[RuleAction] = []
+        rule = self._match(context)
+        if rule is None:
+            return None, None
 
-        self._sort_rules()
-
-        for rule in self.rules:
-            if rule.evaluate(context):
-                _LOGGER.debug("Rule '%s' triggered", rule.name)
-                triggered_rules.append(rule.name)
-                actions.extend(rule.actions)
+        for action in rule.actions:
+            if action.action_type == RuleActionType.TURN_ON_HEATER:
+                return True, rule.name
+            if action.action_type == RuleActionType.TURN_OFF_HEATER:
+                return False, rule.name
+        return None, None
 
-                # For conflicting actions, higher priority wins
-                # We process in priority order, so first match wins
-                break
+    def evaluate(self, context: dict) -> tuple[list[RuleAction], list[str]]:
+        """
+        Evaluate all rules and return actions to take.
 
-        if triggered_rules:
-            self._last_triggered_rule = triggered_rules[0]
-        else:
-            self._last_triggered_rule = None
+        The context is reused by the coordinator between ticks and must not
+        be modified or kept. It may carry the current local time as
+        "_now_time" so time conditions share a single clock read.
 
-        return actions, triggered_rules
+        Returns:
+            Tuple of (actions to execute, list of triggered rule names)
+        """
+        rule = self._match(context)
+        if rule is None:
+            return [], []
+        return list(rule.actions), [rule.name]
 
     def should_heat(self, context: dict) -> tuple[bool, str | None]:
         """
@@ -363,16 +470,11 @@ class RuleEngine:
         Returns:
             Tuple of (should_heat, triggered_rule_name)
         """
-        actions, triggered_rules = self.evaluate(context)
-
-        for action in actions:
-            if action.action_type == RuleActionType.TURN_ON_HEATER:
-                return True, triggered_rules[0] if triggered_rules else None
-            elif action.action_type == RuleActionType.TURN_OFF_HEATER:
-                return False, triggered_rules[0] if triggered_rules else None
-
-        # No explicit action, maintain current state (default off for safety)
-        return False, None
+        decision, rule_name = self._evaluate_decision(context)
+        if decision is None:
+            # No explicit action, maintain current state (default off for safety)
+            return False, None
+        return decision, rule_name
 
     @property
     def last_triggered_rule(self) -> str | None:
@@ -386,4 +488,5 @@ class RuleEngine:
     def from_dict(self, data: list[dict]) -> None:
         """Load rules from dictionary."""
         self.rules = [Rule.from_dict(r) for r in data]
-        self._sort_rules()
+        self._reindex()
+        self._sorted = False
@@ -4,6 +4,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
+from operator import methodcaller
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -24,7 +25,6 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
 from .coordinator import SolarRouterCoordinator
 
 
@@ -36,6 +36,18 @@ class SolarRouterSensorEntityDescription(SensorEntityDescription):
     attr_fn: Callable[[SolarRouterCoordinator], dict[str, Any]] | None = None
 
 
+def _current_rule(data: dict[str, Any]) -> str:
+    """Return the active rule name, or "none" when no rule matched."""
+    return data.get("current_rule") or "none"
+
+
+def _solar_excess(data: dict[str, Any]) -> float:
+    """Return solar power not consumed by the heater, never negative."""
+    solar = data.get("solar_power", 0)
+    heater = data.get("heater_power", 0)
+    return solar - heater if solar > heater else 0
+
+
 SENSOR_DESCRIPTIONS: tuple[SolarRouterSensorEntityDescription, ...] = (
     SolarRouterSensorEntityDescription(
         key="tank_temp_estimate",
@@ -45,7 +57,7 @@ SENSOR_DESCRIPTIONS: tuple[SolarRouterSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:water-thermometer",
-        value_fn=lambda data: data.get("tank_temp_estimate"),
+        value_fn=methodcaller("get", "tank_temp_estimate"),
     ),
     SolarRouterSensorEntityDescription(
         key="daily_heating_time",
@@ -55,7 +67,7 @@ SENSOR_DESCRIPTIONS: tuple[SolarRouterSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfTime.MINUTES,
         state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:clock-outline",
-        value_fn=lambda data: data.get("daily_heating_minutes"),
+        value_fn=methodcaller("get", "daily_heating_minutes"),
     ),
     SolarRouterSensorEntityDescription(
         key="daily_heating_energy",
@@ -65,7 +77,7 @@ SENSOR_DESCRIPTIONS: tuple[SolarRouterSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:lightning-bolt",
-        value_fn=lambda data: data.get("daily_heating_energy_kwh"),
+        value_fn=methodcaller("get", "daily_heating_energy_kwh"),
     ),
     SolarRouterSensorEntityDescription(
         key="energy_content",
@@ -75,7 +87,7 @@ SENSOR_DESCRIPTIONS: tuple[SolarRouterSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:water-boiler",
-        value_fn=lambda data: data.get("energy_content_kwh"),
+        value_fn=methodcaller("get", "energy_content_kwh"),
     ),
     SolarRouterSensorEntityDescription(
         key="estimated_showers",
@@ -84,7 +96,7 @@ SENSOR_DESCRIPTIONS: tuple[SolarRouterSensorEntityDescription, ...] = (
         native_unit_of_measurement="showers",
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:shower-head",
-        value_fn=lambda data: data.get("estimated_showers"),
+        value_fn=methodcaller("get", "estimated_showers"),
     ),
     SolarRouterSensorEntityDescription(
         key="time_to_target",
@@ -93,7 +105,7 @@ SENSOR_DESCRIPTIONS: tuple[SolarRouterSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.DURATION,
         native_unit_of_measurement=UnitOfTime.MINUTES,
         icon="mdi:timer-outline",
-        value_fn=lambda data: data.get("time_to_target_minutes"),
+        value_fn=methodcaller("get", "time_to_target_minutes"),
     ),
     SolarRouterSensorEntityDescription(
         key="time_to_cold",
@@ -102,21 +114,21 @@ SENSOR_DESCRIPTIONS: tuple[SolarRouterSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.DURATION,
         native_unit_of_measurement=UnitOfTime.HOURS,
         icon="mdi:timer-sand",
-        value_fn=lambda data: data.get("time_to_cold_hours"),
+        value_fn=methodcaller("get", "time_to_cold_hours"),
     ),
     SolarRouterSensorEntityDescription(
         key="current_rule",
         translation_key="current_rule",
         name="Active Rule",
         icon="mdi:state-machine",
-        value_fn=lambda data: data.get("current_rule") or "none",
+        value_fn=_current_rule,
     ),
     SolarRouterSensorEntityDescription(
         key="heating_mode",
         translation_key="heating_mode",
         name="Heating Mode",
         icon="mdi:water-boiler",
-        value_fn=lambda data: data.get("heating_mode"),
+        value_fn=methodcaller("get", "heating_mode"),
     ),
     SolarRouterSensorEntityDescription(
         key="heating_sessions_today",
@@ -125,7 +137,7 @@ SENSOR_DESCRIPTIONS: tuple[SolarRouterSensorEntityDescription, ...] = (
         native_unit_of_measurement="sessions",
         state_class=SensorStateClass.TOTAL_INCREASING,
         icon="mdi:counter",
-        value_fn=lambda data: data.get("heating_sessions_today"),
+        value_fn=methodcaller("get", "heating_sessions_today"),
     ),
     SolarRouterSensorEntityDescription(
         key="solar_excess",
@@ -135,7 +147,7 @@ SENSOR_DESCRIPTIONS: tuple[SolarRouterSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfPower.WATT,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:solar-power",
-        value_fn=lambda data: max(0, data.get("solar_power", 0) - data.get("heater_power", 0)),
+        value_fn=_solar_excess,
     ),
     SolarRouterSensorEntityDescription(
         key="battery_soc_mirror",
@@ -145,7 +157,7 @@ SENSOR_DESCRIPTIONS: tuple[SolarRouterSensorEntityDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:battery",
-        value_fn=lambda data: data.get("battery_soc"),
+        value_fn=methodcaller("get", "battery_soc"),
     ),
     SolarRouterSensorEntityDescription(
         key="solar_power_mirror",
@@ -155,7 +167,7 @@ SENSOR_DESCRIPTIONS: tuple[SolarRouterSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfPower.WATT,
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:solar-panel",
-        value_fn=lambda data: data.get("solar_power"),
+        value_fn=methodcaller("get", "solar_power"),
     ),
 )
 
@@ -166,7 +178,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Solar Router sensors based on a config entry."""
-    coordinator: SolarRouterCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator: SolarRouterCoordinator = entry.runtime_data
 
     entities = [
         SolarRouterSensor(coordinator, description, entry)
@@ -195,13 +207,7 @@ class SolarRouterSensor(CoordinatorEntity[SolarRouterCoordinator], SensorEntity)
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": entry.title,
-            "manufacturer": "Solar Router",
-            "model": "Water Heater Router",
-            "sw_version": "1.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> Any:
@@ -235,13 +241,8 @@ class SolarRouterForecastSensor(CoordinatorEntity[SolarRouterCoordinator], Senso
         """Initialize the forecast sensor."""
         super().__init__(coordinator)
         self._attr_unique_id = f"{entry.entry_id}_temperature_forecast"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": entry.title,
-            "manufacturer": "Solar Router",
-            "model": "Water Heater Router",
-            "sw_version": "1.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
+        self._forecast_cache: tuple[int, dict[str, Any]] | None = None
 
     @property
     def native_value(self) -> str:
@@ -253,9 +254,11 @@ class SolarRouterForecastSensor(CoordinatorEntity[SolarRouterCoordinator], Senso
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return forecast data as attributes."""
-        forecast = self.coordinator.get_temperature_forecast(24)
-        return {
-            "forecast": forecast,
-            "forecast_hours": 24,
-            "unit_of_measurement": "°C",
-        }
+        update_count = self.coordinator.update_count
+        if self._forecast_cache is None or self._forecast_cache[0] != update_count:
+            self._forecast_cache = (update_count, {
+                "forecast": self.coordinator.get_temperature_forecast(24),
+                "forecast_hours": 24,
+                "unit_of_measurement": "°C",
+            })
+        return self._forecast_cache[1]
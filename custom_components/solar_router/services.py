@@ -2,10 +2,13 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable, Coroutine
+from functools import partial
 from typing import Any
 
 import voluptuous as vol
 
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.helpers import config_validation as cv
 
@@ -55,6 +58,16 @@ SERVICE_RULE_NAME_SCHEMA = vol.Schema(
     }
 )
 
+_CONDITION_TYPES = frozenset(RuleConditionType)
+
+_CONDITION_SCHEMA = vol.Schema(
+    {
+        vol.Required("type"): vol.In(_CONDITION_TYPES),
+        vol.Required("value"): vol.Any(int, float, str),
+        vol.Optional("value2"): vol.Any(int, float, str, None),
+    }
+)
+
 SERVICE_SET_RULE_SCHEMA = vol.Schema(
     {
         vol.Required("name"): cv.string,
@@ -63,18 +76,7 @@ SERVICE_SET_RULE_SCHEMA = vol.Schema(
         vol.Optional("priority", default=50): vol.All(
             vol.Coerce(int), vol.Range(min=0, max=100)
         ),
-        vol.Required("conditions"): vol.All(
-            cv.ensure_list,
-            [
-                vol.Schema(
-                    {
-                        vol.Required("type"): vol.In([e.value for e in RuleConditionType]),
-                        vol.Required("value"): vol.Any(int, float, str),
-                        vol.Optional("value2"): vol.Any(int, float, str, None),
-                    }
-                )
-            ],
-        ),
+        vol.Required("conditions"): vol.All(cv.ensure_list, [_CONDITION_SCHEMA]),
         vol.Required("action"): vol.In(["turn_on", "turn_off"]),
     }
 )
@@ -82,225 +84,180 @@ SERVICE_SET_RULE_SCHEMA = vol.Schema(
 
 def _get_coordinator(hass: HomeAssistant) -> SolarRouterCoordinator | None:
     """Get the first available coordinator."""
-    if DOMAIN not in hass.data:
-        return None
-    for entry_id, coordinator in hass.data[DOMAIN].items():
-        if isinstance(coordinator, SolarRouterCoordinator):
-            return coordinator
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        if entry.state is ConfigEntryState.LOADED:
+            return entry.runtime_data
     return None
 
 
-async def async_setup_services(hass: HomeAssistant) -> None:
-    """Set up services for Solar Router integration."""
-
-    async def async_handle_force_heating(call: ServiceCall) -> None:
-        """Handle force heating service call."""
-        coordinator = _get_coordinator(hass)
-        if coordinator is None:
-            _LOGGER.error("No Solar Router coordinator found")
-            return
-
-        duration = call.data.get("duration", 60)
-        await coordinator.async_force_heating(duration)
-        _LOGGER.info("Forced heating for %d minutes", duration)
-
-    async def async_handle_stop_heating(call: ServiceCall) -> None:
-        """Handle stop heating service call."""
-        coordinator = _get_coordinator(hass)
-        if coordinator is None:
-            _LOGGER.error("No Solar Router coordinator found")
-            return
-
-        await coordinator.async_stop_heating()
-        _LOGGER.info("Stopped heating")
-
-    async def async_handle_set_tank_temp(call: ServiceCall) -> None:
-        """Handle set tank temperature service call."""
-        coordinator = _get_coordinator(hass)
-        if coordinator is None:
-            _LOGGER.error("No Solar Router coordinator found")
-            return
-
-        temperature = call.data["temperature"]
-        await coordinator.async_set_tank_temperature(temperature)
-        _LOGGER.info("Set tank temperature to %.1f°C", temperature)
-
-    async def async_handle_apply_usage(call: ServiceCall) -> None:
-        """Handle apply usage event service call."""
-        coordinator = _get_coordinator(hass)
-        if coordinator is None:
-            _LOGGER.error("No Solar Router coordinator found")
-            return
-
-        event = call.data["event"]
-        await coordinator.async_apply_usage_event(event)
-        _LOGGER.info("Applied usage event: %s", event)
-
-    async def async_handle_reset_daily_stats(call: ServiceCall) -> None:
-        """Handle reset daily stats service call."""
-        coordinator = _get_coordinator(hass)
-        if coordinator is None:
-            _LOGGER.error("No Solar Router coordinator found")
-            return
-
-        coordinator.water_tank.reset_daily_stats()
-        await coordinator.async_refresh()
-        _LOGGER.info("Reset daily statistics")
-
-    async def async_handle_enable_rule(call: ServiceCall) -> None:
-        """Handle enable rule service call."""
-        coordinator = _get_coordinator(hass)
-        if coordinator is None:
-            _LOGGER.error("No Solar Router coordinator found")
-            return
-
-        rule_name = call.data["rule_name"]
-        if coordinator.rule_engine.enable_rule(rule_name):
-            _LOGGER.info("Enabled rule: %s", rule_name)
-        else:
-            _LOGGER.warning("Rule not found: %s", rule_name)
-
-    async def async_handle_disable_rule(call: ServiceCall) -> None:
-        """Handle disable rule service call."""
-        coordinator = _get_coordinator(hass)
-        if coordinator is None:
-            _LOGGER.error("No Solar Router coordinator found")
-            return
-
-        rule_name = call.data["rule_name"]
-        if coordinator.rule_engine.disable_rule(rule_name):
-            _LOGGER.info("Disabled rule: %s", rule_name)
-        else:
-            _LOGGER.warning("Rule not found: %s", rule_name)
-
-    async def async_handle_remove_rule(call: ServiceCall) -> None:
-        """Handle remove rule service call."""
-        coordinator = _get_coordinator(hass)
-        if coordinator is None:
-            _LOGGER.error("No Solar Router coordinator found")
-            return
-
-        rule_name = call.data["rule_name"]
-        if coordinator.rule_engine.remove_rule(rule_name):
-            _LOGGER.info("Removed rule: %s", rule_name)
-        else:
-            _LOGGER.warning("Rule not found: %s", rule_name)
-
-    async def async_handle_set_rule(call: ServiceCall) -> None:
-        """Handle set rule service call."""
-        coordinator = _get_coordinator(hass)
-        if coordinator is None:
-            _LOGGER.error("No Solar Router coordinator found")
-            return
-
-        # Build conditions
-        conditions = []
-        for cond_data in call.data["conditions"]:
-            conditions.append(
-                RuleCondition(
-                    condition_type=RuleConditionType(cond_data["type"]),
-                    value=cond_data["value"],
-                    value2=cond_data.get("value2"),
-                )
-            )
-
-        # Build action
-        action_type = (
-            RuleActionType.TURN_ON_HEATER
-            if call.data["action"] == "turn_on"
-            else RuleActionType.TURN_OFF_HEATER
-        )
-        actions = [RuleAction(action_type=action_type)]
-
-        # Create and add rule
-        rule = Rule(
-            name=call.data["name"],
-            description=call.data.get("description", ""),
-            conditions=conditions,
-            actions=actions,
-            enabled=call.data.get("enabled", True),
-            priority=call.data.get("priority", 50),
+async def _async_force_heating(
+    coordinator: SolarRouterCoordinator, call: ServiceCall
+) -> None:
+    """Handle force heating service call."""
+    duration = call.data.get("duration", 60)
+    await coordinator.async_force_heating(duration)
+    _LOGGER.info("Forced heating for %d minutes", duration)
+
+
+async def _async_stop_heating(
+    coordinator: SolarRouterCoordinator, call: ServiceCall
+) -> None:
+    """Handle stop heating service call."""
+    await coordinator.async_stop_heating()
+    _LOGGER.info("Stopped heating")
+
+
+async def _async_set_tank_temp(
+    coordinator: SolarRouterCoordinator, call: ServiceCall
+) -> None:
+    """Handle set tank temperature service call."""
+    temperature = call.data["temperature"]
+    await coordinator.async_set_tank_temperature(temperature)
+    _LOGGER.info("Set tank temperature to %.1f°C", temperature)
+
+
+async def _async_apply_usage(
+    coordinator: SolarRouterCoordinator, call: ServiceCall
+) -> None:
+    """Handle apply usage event service call."""
+    event = call.data["event"]
+    await coordinator.async_apply_usage_event(event)
+    _LOGGER.info("Applied usage event: %s", event)
+
+
+async def _async_reset_daily_stats(
+    coordinator: SolarRouterCoordinator, call: ServiceCall
+) -> None:
+    """Handle reset daily stats service call."""
+    await coordinator.async_reset_daily_stats()
+    _LOGGER.info("Reset daily statistics")
+
+
+async def _async_enable_rule(
+    coordinator: SolarRouterCoordinator, call: ServiceCall
+) -> None:
+    """Handle enable rule service call."""
+    rule_name = call.data["rule_name"]
+    if coordinator.rule_engine.enable_rule(rule_name):
+        _LOGGER.info("Enabled rule: %s", rule_name)
+    else:
+        _LOGGER.warning("Rule not found: %s", rule_name)
+
+
+async def _async_disable_rule(
+    coordinator: SolarRouterCoordinator, call: ServiceCall
+) -> None:
+    """Handle disable rule service call."""
+    rule_name = call.data["rule_name"]
+    if coordinator.rule_engine.disable_rule(rule_name):
+        _LOGGER.info("Disabled rule: %s", rule_name)
+    else:
+        _LOGGER.warning("Rule not found: %s", rule_name)
+
+
+async def _async_remove_rule(
+    coordinator: SolarRouterCoordinator, call: ServiceCall
+) -> None:
+    """Handle remove rule service call."""
+    rule_name = call.data["rule_name"]
+    if coordinator.rule_engine.remove_rule(rule_name):
+        _LOGGER.info("Removed rule: %s", rule_name)
+    else:
+        _LOGGER.warning("Rule not found: %s", rule_name)
+
+
+async def _async_set_rule(
+    coordinator: SolarRouterCoordinator, call: ServiceCall
+) -> None:
+    """Handle set rule service call."""
+    # Build conditions
+    conditions = tuple(
+        RuleCondition(
+            condition_type=RuleConditionType(cond_data["type"]),
+            value=cond_data["value"],
+            value2=cond_data.get("value2"),
         )
-
-        coordinator.rule_engine.add_rule(rule)
-        _LOGGER.info("Added/updated rule: %s", rule.name)
-
-    # Register services
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_FORCE_HEATING,
-        async_handle_force_heating,
-        schema=SERVICE_FORCE_HEATING_SCHEMA,
+        for cond_data in call.data["conditions"]
     )
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_STOP_HEATING,
-        async_handle_stop_heating,
+    # Build action
+    action_type = (
+        RuleActionType.TURN_ON_HEATER
+        if call.data["action"] == "turn_on"
+        else RuleActionType.TURN_OFF_HEATER
     )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SET_TANK_TEMP,
-        async_handle_set_tank_temp,
-        schema=SERVICE_SET_TANK_TEMP_SCHEMA,
-    )
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_APPLY_USAGE,
-        async_handle_apply_usage,
-        schema=SERVICE_APPLY_USAGE_SCHEMA,
+    actions = [RuleAction(action_type=action_type)]
+
+    # Create and add rule
+    rule = Rule(
+        name=call.data["name"],
+        description=call.data.get("description", ""),
+        conditions=conditions,
+        actions=actions,
+        enabled=call.data.get("enabled", True),
+        priority=call.data.get("priority", 50),
     )
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_RESET_DAILY_STATS,
-        async_handle_reset_daily_stats,
-    )
+    coordinator.rule_engine.add_rule(rule)
+    _LOGGER.info("Added/updated rule: %s", rule.name)
+
+
+_ServiceHandler = Callable[
+    [SolarRouterCoordinator, ServiceCall], Coroutine[Any, Any, None]
+]
+
+# (service name, schema, handler)
+_SERVICES: tuple[tuple[str, vol.Schema | None, _ServiceHandler], ...] = (
+    (SERVICE_FORCE_HEATING, SERVICE_FORCE_HEATING_SCHEMA, _async_force_heating),
+    (SERVICE_STOP_HEATING, None, _async_stop_heating),
+    (SERVICE_SET_TANK_TEMP, SERVICE_SET_TANK_TEMP_SCHEMA, _async_set_tank_temp),
+    (SERVICE_APPLY_USAGE, SERVICE_APPLY_USAGE_SCHEMA, _async_apply_usage),
+    (SERVICE_RESET_DAILY_STATS, None, _async_reset_daily_stats),
+    (SERVICE_ENABLE_RULE, SERVICE_RULE_NAME_SCHEMA, _async_enable_rule),
+    (SERVICE_DISABLE_RULE, SERVICE_RULE_NAME_SCHEMA, _async_disable_rule),
+    (SERVICE_REMOVE_RULE, SERVICE_RULE_NAME_SCHEMA, _async_remove_rule),
+    (SERVICE_SET_RULE, SERVICE_SET_RULE_SCHEMA, _async_set_rule),
+)
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_ENABLE_RULE,
-        async_handle_enable_rule,
-        schema=SERVICE_RULE_NAME_SCHEMA,
-    )
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_DISABLE_RULE,
-        async_handle_disable_rule,
-        schema=SERVICE_RULE_NAME_SCHEMA,
-    )
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Set up services for Solar Router integration."""
+    if hass.services.has_service(DOMAIN, SERVICE_FORCE_HEATING):
+        # Already registered by another config entry
+        return
+
+    cached: SolarRouterCoordinator | None = None
+
+    def get_coordinator() -> SolarRouterCoordinator | None:
+        """Return the cached coordinator while its entry stays loaded with it."""
+        nonlocal cached
+        if (
+            cached is None
+            or cached.config_entry.state is not ConfigEntryState.LOADED
+            or cached.config_entry.runtime_data is not cached
+        ):
+            cached = _get_coordinator(hass)
+        return cached
+
+    async def async_dispatch(handler: _ServiceHandler, call: ServiceCall) -> None:
+        """Resolve the coordinator and run the service handler."""
+        coordinator = get_coordinator()
+        if coordinator is None:
+            _LOGGER.error("No Solar Router coordinator found")
+            return
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_REMOVE_RULE,
-        async_handle_remove_rule,
-        schema=SERVICE_RULE_NAME_SCHEMA,
-    )
+        await handler(coordinator, call)
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_SET_RULE,
-        async_handle_set_rule,
-        schema=SERVICE_SET_RULE_SCHEMA,
-    )
+    for service, schema, handler in _SERVICES:
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            partial(async_dispatch, handler),
+            schema=schema,
+        )
 
 
 async def async_unload_services(hass: HomeAssistant) -> None:
     """Unload Solar Router services."""
-    services = [
-        SERVICE_FORCE_HEATING,
-        SERVICE_STOP_HEATING,
-        SERVICE_SET_TANK_TEMP,
-        SERVICE_APPLY_USAGE,
-        SERVICE_RESET_DAILY_STATS,
-        SERVICE_ENABLE_RULE,
-        SERVICE_DISABLE_RULE,
-        SERVICE_REMOVE_RULE,
-        SERVICE_SET_RULE,
-    ]
-
-    for service in services:
+    for service, _schema, _handler in _SERVICES:
         hass.services.async_remove(DOMAIN, service)
@@ -1,6 +1,7 @@
 """Switch platform for Solar Router integration."""
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
@@ -9,22 +10,33 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
 from .coordinator import SolarRouterCoordinator
 
 
-SWITCH_DESCRIPTIONS: tuple[SwitchEntityDescription, ...] = (
-    SwitchEntityDescription(
+@dataclass(frozen=True, kw_only=True)
+class SolarRouterSwitchEntityDescription(SwitchEntityDescription):
+    """Describes a Solar Router switch backed by a coordinator flag."""
+
+    data_key: str
+    setter: str
+
+
+SWITCH_DESCRIPTIONS: tuple[SolarRouterSwitchEntityDescription, ...] = (
+    SolarRouterSwitchEntityDescription(
         key="auto_mode",
         translation_key="auto_mode",
         name="Auto Mode",
         icon="mdi:robot",
+        data_key="auto_mode_enabled",
+        setter="async_set_auto_mode",
     ),
-    SwitchEntityDescription(
+    SolarRouterSwitchEntityDescription(
         key="offpeak_fallback",
         translation_key="offpeak_fallback",
         name="Off-Peak Fallback",
         icon="mdi:clock-alert",
+        data_key="offpeak_fallback_enabled",
+        setter="async_set_offpeak_fallback",
     ),
 )
 
@@ -35,97 +47,51 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Solar Router switches based on a config entry."""
-    coordinator: SolarRouterCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator: SolarRouterCoordinator = entry.runtime_data
 
     entities: list[SwitchEntity] = [
-        SolarRouterAutoModeSwitch(coordinator, SWITCH_DESCRIPTIONS[0], entry),
-        SolarRouterOffpeakFallbackSwitch(coordinator, SWITCH_DESCRIPTIONS[1], entry),
-        SolarRouterForceHeatingSwitch(coordinator, entry),
+        SolarRouterFlagSwitch(coordinator, description, entry)
+        for description in SWITCH_DESCRIPTIONS
     ]
+    entities.append(SolarRouterForceHeatingSwitch(coordinator, entry))
 
     async_add_entities(entities)
 
 
-class SolarRouterAutoModeSwitch(
-    CoordinatorEntity[SolarRouterCoordinator], SwitchEntity
-):
-    """Switch to enable/disable auto mode."""
-
-    _attr_has_entity_name = True
-
-    def __init__(
-        self,
-        coordinator: SolarRouterCoordinator,
-        description: SwitchEntityDescription,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the switch."""
-        super().__init__(coordinator)
-        self.entity_description = description
-        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": entry.title,
-            "manufacturer": "Solar Router",
-            "model": "Water Heater Router",
-            "sw_version": "1.0.0",
-        }
-
-    @property
-    def is_on(self) -> bool:
-        """Return true if auto mode is enabled."""
-        if self.coordinator.data is None:
-            return False
-        return self.coordinator.data.get("auto_mode_enabled", False)
-
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn on auto mode."""
-        await self.coordinator.async_set_auto_mode(True)
-
-    async def async_turn_off(self, **kwargs: Any) -> None:
-        """Turn off auto mode."""
-        await self.coordinator.async_set_auto_mode(False)
-
-
-class SolarRouterOffpeakFallbackSwitch(
+class SolarRouterFlagSwitch(
     CoordinatorEntity[SolarRouterCoordinator], SwitchEntity
 ):
-    """Switch to enable/disable off-peak fallback."""
+    """Switch toggling a boolean coordinator setting."""
 
     _attr_has_entity_name = True
+    entity_description: SolarRouterSwitchEntityDescription
 
     def __init__(
         self,
         coordinator: SolarRouterCoordinator,
-        description: SwitchEntityDescription,
+        description: SolarRouterSwitchEntityDescription,
         entry: ConfigEntry,
     ) -> None:
         """Initialize the switch."""
         super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": entry.title,
-            "manufacturer": "Solar Router",
-            "model": "Water Heater Router",
-            "sw_version": "1.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool:
-        """Return true if off-peak fallback is enabled."""
+        """Return true if the setting is enabled."""
         if self.coordinator.data is None:
             return False
-        return self.coordinator.data.get("offpeak_fallback_enabled", False)
+        return self.coordinator.data.get(self.entity_description.data_key, False)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn on off-peak fallback."""
-        await self.coordinator.async_set_offpeak_fallback(True)
+        """Enable the setting."""
+        await getattr(self.coordinator, self.entity_description.setter)(True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        """Turn off off-peak fallback."""
-        await self.coordinator.async_set_offpeak_fallback(False)
+        """Disable the setting."""
+        await getattr(self.coordinator, self.entity_description.setter)(False)
 
 
 class SolarRouterForceHeatingSwitch(
@@ -145,13 +111,7 @@ class SolarRouterForceHeatingSwitch(
         """Initialize the switch."""
         super().__init__(coordinator)
         self._attr_unique_id = f"{entry.entry_id}_force_heating"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": entry.title,
-            "manufacturer": "Solar Router",
-            "model": "Water Heater Router",
-            "sw_version": "1.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool:
@@ -2,8 +2,10 @@
 from __future__ import annotations
 
 import logging
+import math
+import time
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
 from homeassistant.util import dt as dt_util
@@ -32,7 +34,20 @@ WATER_SPECIFIC_HEAT = 4186  # J/(kg·°C)
 WATER_DENSITY = 1  # kg/L
 
 
-@dataclass
+def _timestamp_to_iso(timestamp: float | None) -> str | None:
+    """Convert an epoch timestamp to a UTC ISO string."""
+    if timestamp is None:
+        return None
+    return dt_util.utc_from_timestamp(timestamp).isoformat()
+
+
+def _iso_to_timestamp(value: str) -> float | None:
+    """Convert an ISO string to an epoch timestamp, None if malformed."""
+    parsed = dt_util.parse_datetime(value)
+    return parsed.timestamp() if parsed else None
+
+
+@dataclass(frozen=True, slots=True)
 class WaterUsageEvent:
     """Represents a water usage event."""
 
@@ -40,30 +55,60 @@ class WaterUsageEvent:
     duration_minutes: float
     flow_rate_lpm: float
     hot_water_fraction: float = 0.7  # 70% hot water typically
+    volume_liters: float = field(init=False)  # Total hot water used
 
-    @property
-    def volume_liters(self) -> float:
+    def __post_init__(self) -> None:
         """Calculate total volume used."""
-        return self.duration_minutes * self.flow_rate_lpm * self.hot_water_fraction
+        object.__setattr__(
+            self,
+            "volume_liters",
+            self.duration_minutes * self.flow_rate_lpm * self.hot_water_fraction,
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class TankState:
     """Current state of the water tank."""
 
     estimated_temp: float = DEFAULT_TARGET_TEMP
-    last_update: datetime = field(default_factory=dt_util.utcnow)
-    last_heating_start: datetime | None = None
-    last_heating_end: datetime | None = None
-    total_heating_today: timedelta = field(default_factory=lambda: timedelta(0))
+    # Epoch timestamps; converted to ISO strings only when persisted
+    last_update: float = field(default_factory=time.time)
+    last_heating_start: float | None = None
+    last_heating_end: float | None = None
+    total_heating_today_seconds: float = 0.0
     total_energy_today: float = 0.0  # kWh
     heating_sessions_today: int = 0
     is_heating: bool = False
 
+    @property
+    def total_heating_today(self) -> timedelta:
+        """Return today's heating time as a timedelta."""
+        return timedelta(seconds=self.total_heating_today_seconds)
+
 
 class WaterTankModel:
     """Model for water tank temperature estimation."""
 
+    __slots__ = (
+        "volume_liters",
+        "heater_wattage",
+        "heat_loss_rate",
+        "cold_water_temp",
+        "target_temp",
+        "min_temp",
+        "ambient_temp",
+        "state",
+        "usage_events",
+        "_usage_ratios",
+        "_thermal_mass",
+        "_heating_rate",
+        "_heating_rate_per_hour",
+        "_heat_loss_norm",
+        "_energy_per_sec_kwh",
+        "_energy_cache",
+        "_showers_cache",
+    )
+
     def __init__(
         self,
         volume_liters: float = DEFAULT_TANK_VOLUME,
@@ -84,6 +129,18 @@ class WaterTankModel:
         self.ambient_temp = ambient_temp
         self.state = TankState()
 
+        # Derived constants, fixed for the lifetime of the model
+        self._thermal_mass = volume_liters * WATER_DENSITY * WATER_SPECIFIC_HEAT
+        self._heating_rate = heater_wattage / self._thermal_mass
+        self._heating_rate_per_hour = self._heating_rate * 3600
+        self._heat_loss_norm = 1.0 / (DEFAULT_TARGET_TEMP - DEFAULT_AMBIENT_TEMP)
+        self._energy_per_sec_kwh = heater_wattage / 3600000
+
+        # (temperature, value) of the last energy and shower estimates; both
+        # only depend on the temperature once the model is built
+        self._energy_cache: tuple[float, float] = (math.nan, 0.0)
+        self._showers_cache: tuple[float, float] = (math.nan, 0.0)
+
         # Define standard usage events
         self.usage_events = {
             "shower": WaterUsageEvent(
@@ -98,25 +155,32 @@ class WaterTankModel:
             ),
         }
 
+        # Share of the tank each event replaces with cold water; an event
+        # using more than the tank volume replaces all of it
+        self._usage_ratios = {
+            name: min(event.volume_liters / volume_liters, 1.0)
+            for name, event in self.usage_events.items()
+        }
+
     @property
     def tank_thermal_mass(self) -> float:
         """Calculate thermal mass of water in tank (J/°C)."""
-        return self.volume_liters * WATER_DENSITY * WATER_SPECIFIC_HEAT
+        return self._thermal_mass
 
     @property
     def heating_rate(self) -> float:
         """Calculate temperature increase rate when heating (°C/second)."""
-        return self.heater_wattage / self.tank_thermal_mass
+        return self._heating_rate
 
     @property
     def heating_rate_per_minute(self) -> float:
         """Calculate temperature increase rate when heating (°C/minute)."""
-        return self.heating_rate * 60
+        return self._heating_rate * 60
 
     @property
     def heating_rate_per_hour(self) -> float:
         """Calculate temperature increase rate when heating (°C/hour)."""
-        return self.heating_rate * 3600
+        return self._heating_rate_per_hour
 
     def calculate_heat_loss(self, hours: float) -> float:
         """Calculate temperature drop due to heat loss over time."""
@@ -125,23 +189,14 @@ class WaterTankModel:
         if temp_diff <= 0:
             return 0
         # Heat loss is proportional to temperature difference
-        return self.heat_loss_rate * hours * (temp_diff / (DEFAULT_TARGET_TEMP - DEFAULT_AMBIENT_TEMP))
-
-    def calculate_usage_temp_drop(self, event: WaterUsageEvent) -> float:
-        """Calculate temperature drop from water usage event."""
-        hot_water_used = event.volume_liters
-        if hot_water_used >= self.volume_liters:
-            # Tank completely replaced
-            return self.state.estimated_temp - self.cold_water_temp
+        return self.heat_loss_rate * hours * temp_diff * self._heat_loss_norm
 
-        # Mix calculation
-        remaining_volume = self.volume_liters - hot_water_used
-        new_temp = (
-            (remaining_volume * self.state.estimated_temp)
-            + (hot_water_used * self.cold_water_temp)
-        ) / self.volume_liters
-
-        return self.state.estimated_temp - new_temp
+    def calculate_usage_temp_drop(self, event_name: str) -> float:
+        """Calculate temperature drop from a named water usage event."""
+        # Mixing cold water into the tank moves the temperature towards the
+        # cold water temperature in proportion to the volume replaced
+        ratio = self._usage_ratios[event_name]
+        return (self.state.estimated_temp - self.cold_water_temp) * ratio
 
     def update_temperature(
         self,
@@ -149,43 +204,49 @@ class WaterTankModel:
         elapsed_seconds: float,
     ) -> float:
         """Update estimated temperature based on heating state and time."""
-        now = dt_util.utcnow()
-        hours_elapsed = elapsed_seconds / 3600
+        now = time.time()
+        state = self.state
+        estimated = state.estimated_temp
+        was_heating = state.is_heating
+
+        # Heat loss is proportional to the difference with ambient
+        # (inlined calculate_heat_loss)
+        temp_diff = estimated - self.ambient_temp
+        temp_loss = (
+            self.heat_loss_rate * (elapsed_seconds / 3600) * temp_diff * self._heat_loss_norm
+            if temp_diff > 0
+            else 0.0
+        )
 
         if is_heating:
-            # Temperature increases from heating
-            temp_increase = self.heating_rate * elapsed_seconds
-
-            # Account for heat loss even while heating
-            temp_loss = self.calculate_heat_loss(hours_elapsed)
-
-            new_temp = self.state.estimated_temp + temp_increase - temp_loss
-
-            # Cap at target temperature (thermostat effect)
-            new_temp = min(new_temp, self.target_temp)
+            # Temperature increases from heating, minus heat loss; capped at
+            # target temperature (thermostat effect)
+            new_temp = estimated + self._heating_rate * elapsed_seconds - temp_loss
+            target_temp = self.target_temp
+            if new_temp > target_temp:
+                new_temp = target_temp
 
             # Track heating time
-            if not self.state.is_heating:
-                self.state.last_heating_start = now
-                self.state.heating_sessions_today += 1
+            if not was_heating:
+                state.last_heating_start = now
+                state.heating_sessions_today += 1
 
-            self.state.total_heating_today += timedelta(seconds=elapsed_seconds)
-            self.state.total_energy_today += (self.heater_wattage * elapsed_seconds) / 3600000  # kWh
+            state.total_heating_today_seconds += elapsed_seconds
+            state.total_energy_today += self._energy_per_sec_kwh * elapsed_seconds  # kWh
 
         else:
-            # Only heat loss when not heating
-            temp_loss = self.calculate_heat_loss(hours_elapsed)
-            new_temp = self.state.estimated_temp - temp_loss
-
-            # Can't go below cold water temp
-            new_temp = max(new_temp, self.cold_water_temp)
+            # Only heat loss when not heating; can't go below cold water temp
+            new_temp = estimated - temp_loss
+            cold_water_temp = self.cold_water_temp
+            if new_temp < cold_water_temp:
+                new_temp = cold_water_temp
 
-            if self.state.is_heating:
-                self.state.last_heating_end = now
+            if was_heating:
+                state.last_heating_end = now
 
-        self.state.estimated_temp = new_temp
-        self.state.is_heating = is_heating
-        self.state.last_update = now
+        state.estimated_temp = new_temp
+        state.is_heating = is_heating
+        state.last_update = now
 
         return new_temp
 
@@ -195,8 +256,7 @@ class WaterTankModel:
             _LOGGER.warning("Unknown usage event: %s", event_name)
             return self.state.estimated_temp
 
-        event = self.usage_events[event_name]
-        temp_drop = self.calculate_usage_temp_drop(event)
+        temp_drop = self.calculate_usage_temp_drop(event_name)
         self.state.estimated_temp -= temp_drop
 
         _LOGGER.debug(
@@ -217,7 +277,7 @@ class WaterTankModel:
 
         # Account for heat loss during heating
         # This is a simplified calculation
-        net_heating_rate = self.heating_rate_per_hour - (self.heat_loss_rate / 2)
+        net_heating_rate = self._heating_rate_per_hour - (self.heat_loss_rate / 2)
         if net_heating_rate <= 0:
             return None  # Can't reach target
 
@@ -236,47 +296,56 @@ class WaterTankModel:
 
     def estimated_showers_available(self) -> float:
         """Estimate number of showers available at current temperature."""
-        if self.state.estimated_temp <= self.min_temp:
+        temp = self.state.estimated_temp
+        cached_temp, cached_showers = self._showers_cache
+        if temp == cached_temp:
+            return cached_showers
+
+        showers = self._estimate_showers(temp)
+        self._showers_cache = (temp, showers)
+        return showers
+
+    def _estimate_showers(self, temp: float) -> float:
+        """Estimate number of showers available at the given temperature."""
+        if temp <= self.min_temp:
             return 0
 
-        shower = self.usage_events["shower"]
+        # Each shower scales the excess over cold water by the same ratio, so
+        # the count of full showers has a closed form; the last one is partial
+        remaining_ratio = 1 - self.usage_events["shower"].volume_liters / self.volume_liters
+        excess = temp - self.cold_water_temp
+        min_excess = self.min_temp - self.cold_water_temp
 
-        # Calculate how many showers until we hit min temp
-        current_temp = self.state.estimated_temp
         showers = 0
-
-        while current_temp > self.min_temp:
-            # Simulate a shower
-            hot_water_used = shower.volume_liters
-            remaining_volume = self.volume_liters - hot_water_used
-
-            new_temp = (
-                (remaining_volume * current_temp)
-                + (hot_water_used * self.cold_water_temp)
-            ) / self.volume_liters
-
-            if new_temp < self.min_temp:
-                # Partial shower possible
-                showers += (current_temp - self.min_temp) / (current_temp - new_temp)
-                break
-
-            current_temp = new_temp
-            showers += 1
+        if remaining_ratio > 0:
+            showers = math.floor(math.log(min_excess / excess) / math.log(remaining_ratio))
+            # Correct for floating point error at the boundaries
+            while excess * remaining_ratio ** (showers + 1) >= min_excess:
+                showers += 1
+            while showers > 0 and excess * remaining_ratio ** showers < min_excess:
+                showers -= 1
+            excess *= remaining_ratio ** showers
+
+        # Partial shower possible
+        showers += (excess - min_excess) / (excess * (1 - remaining_ratio))
 
         return round(showers, 1)
 
     def energy_content(self) -> float:
         """Calculate energy content of tank above cold water temp (kWh)."""
-        temp_diff = self.state.estimated_temp - self.cold_water_temp
-        if temp_diff <= 0:
-            return 0
+        temp = self.state.estimated_temp
+        cached_temp, cached_energy = self._energy_cache
+        if temp == cached_temp:
+            return cached_energy
 
-        energy_joules = self.tank_thermal_mass * temp_diff
-        return energy_joules / 3600000  # Convert to kWh
+        temp_diff = temp - self.cold_water_temp
+        energy = self._thermal_mass * temp_diff / 3600000 if temp_diff > 0 else 0  # kWh
+        self._energy_cache = (temp, energy)
+        return energy
 
     def reset_daily_stats(self) -> None:
         """Reset daily statistics (should be called at midnight)."""
-        self.state.total_heating_today = timedelta(0)
+        self.state.total_heating_today_seconds = 0.0
         self.state.total_energy_today = 0.0
         self.state.heating_sessions_today = 0
 
@@ -286,40 +355,41 @@ class WaterTankModel:
             self.cold_water_temp,
             min(temp, self.target_temp + 10),  # Allow some overshoot
         )
-        self.state.last_update = dt_util.utcnow()
+        self.state.last_update = time.time()
 
     def get_forecast(self, hours_ahead: int = 24) -> list[dict]:
         """Generate temperature forecast for the next N hours."""
         forecast = []
         current_temp = self.state.estimated_temp
-        current_time = dt_util.now()
+        cold_water_temp = self.cold_water_temp
+        heat_loss_rate = self.heat_loss_rate
+        forecast_time = dt_util.now()
+        start_hour = forecast_time.hour
+        one_hour = timedelta(hours=1)
+
+        # Usage drops are taken from the current temperature, so they are
+        # the same for every hour: morning shower around 7-8 AM, evening
+        # dishes around 7-8 PM
+        usage_schedule = {
+            7: self.calculate_usage_temp_drop("shower"),
+            19: self.calculate_usage_temp_drop("dishes"),
+        }
 
         for hour in range(hours_ahead + 1):
             # Simple forecast assuming no heating and daily usage pattern
-            temp = current_temp
-
             # Apply heat loss
-            temp -= self.heat_loss_rate * hour
-
-            # Simulate typical daily usage (morning and evening)
-            forecast_time = current_time + timedelta(hours=hour)
-            hour_of_day = forecast_time.hour
+            temp = current_temp - heat_loss_rate * hour
 
-            # Morning shower around 7-8 AM
-            if hour_of_day == 7:
-                temp -= self.calculate_usage_temp_drop(self.usage_events["shower"])
-
-            # Evening dishes around 7-8 PM
-            if hour_of_day == 19:
-                temp -= self.calculate_usage_temp_drop(self.usage_events["dishes"])
-
-            temp = max(temp, self.cold_water_temp)
+            # Simulate typical daily usage (morning and evening); aware
+            # datetime arithmetic is wall-clock, so the hour just wraps
+            temp -= usage_schedule.get((start_hour + hour) % 24, 0.0)
 
             forecast.append({
                 "time": forecast_time.isoformat(),
-                "temperature": round(temp, 1),
+                "temperature": round(temp if temp > cold_water_temp else cold_water_temp, 1),
                 "hour": hour,
             })
+            forecast_time += one_hour
 
         return forecast
 
@@ -327,10 +397,10 @@ class WaterTankModel:
         """Serialize state to dictionary."""
         return {
             "estimated_temp": self.state.estimated_temp,
-            "last_update": self.state.last_update.isoformat() if self.state.last_update else None,
-            "last_heating_start": self.state.last_heating_start.isoformat() if self.state.last_heating_start else None,
-            "last_heating_end": self.state.last_heating_end.isoformat() if self.state.last_heating_end else None,
-            "total_heating_today_seconds": self.state.total_heating_today.total_seconds(),
+            "last_update": _timestamp_to_iso(self.state.last_update),
+            "last_heating_start": _timestamp_to_iso(self.state.last_heating_start),
+            "last_heating_end": _timestamp_to_iso(self.state.last_heating_end),
+            "total_heating_today_seconds": self.state.total_heating_today_seconds,
             "total_energy_today": self.state.total_energy_today,
             "heating_sessions_today": self.state.heating_sessions_today,
             "is_heating": self.state.is_heating,
@@ -341,20 +411,23 @@ class WaterTankModel:
         if not data:
             return
 
-        self.state.estimated_temp = data.get("estimated_temp", DEFAULT_TARGET_TEMP)
+        state = self.state
+        get = data.get
 
-        if data.get("last_update"):
-            self.state.last_update = datetime.fromisoformat(data["last_update"])
+        state.estimated_temp = get("estimated_temp", DEFAULT_TARGET_TEMP)
 
-        if data.get("last_heating_start"):
-            self.state.last_heating_start = datetime.fromisoformat(data["last_heating_start"])
+        if last_update := get("last_update"):
+            # Keep the current timestamp rather than storing None when the
+            # stored value is malformed
+            state.last_update = _iso_to_timestamp(last_update) or state.last_update
 
-        if data.get("last_heating_end"):
-            self.state.last_heating_end = datetime.fromisoformat(data["last_heating_end"])
+        if last_heating_start := get("last_heating_start"):
+            state.last_heating_start = _iso_to_timestamp(last_heating_start)
 
-        self.state.total_heating_today = timedelta(
-            seconds=data.get("total_heating_today_seconds", 0)
-        )
-        self.state.total_energy_today = data.get("total_energy_today", 0.0)
-        self.state.heating_sessions_today = data.get("heating_sessions_today", 0)
-        self.state.is_heating = data.get("is_heating", False)
+        if last_heating_end := get("last_heating_end"):
+            state.last_heating_end = _iso_to_timestamp(last_heating_end)
+
+        state.total_heating_today_seconds = float(get("total_heating_today_seconds", 0))
+        state.total_energy_today = get("total_energy_today", 0.0)
+        state.heating_sessions_today = get("heating_sessions_today", 0)
+        state.is_heating = get("is_heating", False)